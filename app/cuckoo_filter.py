@@ -0,0 +1,181 @@
+# cuckoo_filter.py
+import math
+import random
+
+from array import array
+
+_MASK64 = (1 << 64) - 1
+
+class CuckooFilter:
+    """
+    A probabilistic set of keys, supporting deletion, built on a cuckoo
+    hash table of small fingerprints.
+
+    Membership can report false positives at roughly the configured
+    error rate, but never false negatives for keys that were added and
+    not discarded.  It is meant to sit in front of an exact check, so
+    the exact check only runs on a filter hit.
+    """
+
+    BUCKET_SIZE = 4
+    MAX_KICKS = 500
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Initialize an empty filter.
+
+        Args:
+            capacity (int):
+                The number of keys the filter is sized for.
+            error_rate (float):
+                The target false positive rate, between 0 and 1.
+
+        Raises:
+            ValueError if the capacity or error rate is out of range.
+        """
+
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1!")
+
+        if not 0 < error_rate < 1:
+            raise ValueError("Error rate must be between 0 and 1!")
+
+        # A lookup compares against 2 buckets of fingerprints, so each
+        # fingerprint needs log2(2 * bucket size / error rate) bits.
+        bits = min(32, math.ceil(math.log2(2 * self.BUCKET_SIZE / error_rate)))
+        buckets = 1 << max(0, math.ceil(math.log2(capacity / (self.BUCKET_SIZE * 0.95))))
+
+        self._fingerprint_mask = (1 << bits) - 1
+        self._bucket_mask = buckets - 1
+        typecode = "B" if bits <= 8 else "H" if bits <= 16 else "L"
+        self._slots = array(typecode, [0]) * (buckets * self.BUCKET_SIZE)
+        self._stash = []                        # Fingerprints that could not be placed
+        self._count = 0
+        self._random = random.Random(0)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Get the memory used by the fingerprint table.
+
+        Returns:
+            int: The size of the table in bytes.
+        """
+
+        return self._slots.itemsize * len(self._slots)
+
+    def add(self, key):
+        """
+        Add a key to the filter.  A key that cannot be placed once the
+        filter is over capacity goes to a small overflow stash, so it is
+        never lost.
+        """
+
+        fingerprint, index = self._locate(key)
+        alternate = self._alternate(index, fingerprint)
+
+        self._count += 1
+
+        if self._place(index, fingerprint) or self._place(alternate, fingerprint):
+            return
+
+        # Both buckets are full, kick fingerprints to their other bucket
+        index = self._random.choice((index, alternate))
+
+        for _ in range(self.MAX_KICKS):
+            slot = index * self.BUCKET_SIZE + self._random.randrange(self.BUCKET_SIZE)
+            fingerprint, self._slots[slot] = self._slots[slot], fingerprint
+
+            index = self._alternate(index, fingerprint)
+            if self._place(index, fingerprint):
+                return
+
+        self._stash.append((index, fingerprint))
+
+    def discard(self, key):
+        """
+        Remove a key from the filter, only keys that were added should
+        be discarded.
+        """
+
+        fingerprint, index = self._locate(key)
+
+        for bucket in (index, self._alternate(index, fingerprint)):
+            start = bucket * self.BUCKET_SIZE
+            for slot in range(start, start + self.BUCKET_SIZE):
+                if self._slots[slot] == fingerprint:
+                    self._slots[slot] = 0
+                    self._count -= 1
+                    return
+
+        for i, (bucket, stashed) in enumerate(self._stash):
+            if stashed == fingerprint and bucket in (index, self._alternate(index, fingerprint)):
+                del self._stash[i]
+                self._count -= 1
+                return
+
+    def clear(self):
+        """
+        Remove every key from the filter.
+        """
+
+        self._slots = array(self._slots.typecode, [0]) * len(self._slots)
+        self._stash.clear()
+        self._count = 0
+
+    def __contains__(self, key) -> bool:
+        fingerprint, index = self._locate(key)
+        start = index * self.BUCKET_SIZE
+
+        if fingerprint in self._slots[start:start + self.BUCKET_SIZE]:
+            return True
+
+        alternate = self._alternate(index, fingerprint)
+        start = alternate * self.BUCKET_SIZE
+
+        if fingerprint in self._slots[start:start + self.BUCKET_SIZE]:
+            return True
+
+        return any(stashed == fingerprint and bucket in (index, alternate)
+                   for bucket, stashed in self._stash)
+
+    def __len__(self):
+        return self._count
+
+    def _locate(self, key):
+        """
+        Hashes a key to its fingerprint and primary bucket.  The hash is
+         mixed so that integer keys, which hash to themselves, spread out.
+        """
+
+        h = hash(key) & _MASK64
+        h = ((h ^ (h >> 33)) * 0xff51afd7ed558ccd) & _MASK64
+        h = ((h ^ (h >> 33)) * 0xc4ceb9fe1a85ec53) & _MASK64
+        h ^= h >> 33
+
+        fingerprint = (h >> 32) & self._fingerprint_mask or 1    # 0 marks empty
+        return fingerprint, h & self._bucket_mask
+
+    def _alternate(self, index: int, fingerprint: int) -> int:
+        """
+        Gets the other bucket for a fingerprint, from either bucket.
+        """
+
+        return (index ^ (fingerprint * 0x5bd1e995)) & self._bucket_mask
+
+    def _place(self, index: int, fingerprint: int) -> bool:
+        """
+        Puts a fingerprint in an empty slot of a bucket.
+
+        Returns:
+            True if there was an empty slot, otherwise False.
+        """
+
+        start = index * self.BUCKET_SIZE
+
+        for slot in range(start, start + self.BUCKET_SIZE):
+            if not self._slots[slot]:
+                self._slots[slot] = fingerprint
+                return True
+
+        return False
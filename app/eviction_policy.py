@@ -0,0 +1,17 @@
+# eviction_policy.py
+
+from enum import Enum
+
+class EvictionPolicy(Enum):
+    """
+    What a bounded PlayerList does when an insert would exceed its
+    maximum length.
+
+    - DROP_OLDEST: Remove the node at the tail of the list.
+    - DROP_NEWEST: Remove the node at the head of the list.
+    - REJECT: Refuse the insert and raise an error.
+    """
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    REJECT = "reject"
@@ -0,0 +1,66 @@
+# player_event.py
+
+from enum import Enum
+from typing import Any, NamedTuple
+
+from app.player import Player
+from app.player_node import PlayerNode
+
+class EventKind(Enum):
+    """
+    The kinds of PlayerList mutation events.
+
+    - INSERTED: A player was inserted at the index.
+    - REMOVED: The player with the key was removed.
+    - MOVED: The player with the key was moved to the index.
+    - CLEARED: Every player was removed.
+    - REORDERED: The list was sorted into the order of keys given.
+    """
+
+    INSERTED = "inserted"
+    REMOVED = "removed"
+    MOVED = "moved"
+    CLEARED = "cleared"
+    REORDERED = "reordered"
+
+class PlayerEvent(NamedTuple):
+    """
+    A structured PlayerList mutation event, delivered to subscribers in
+    batches so that replicas can apply deltas instead of diffing.
+
+    The index follows PlayerList.insert, 0 is the head of the list and
+    -1 is the tail.  It is None for removals, and the key is None when
+    the list was cleared.  An insert with an anchor key went directly
+    after the anchor's node instead of at an index.  A reorder carries
+    every key, in the new order.
+    """
+
+    kind: EventKind
+    key: Any
+    name: str = None
+    index: int = None
+    anchor: Any = None
+    order: tuple = None
+
+    def apply(self, player_list):
+        """
+        Apply the event to a replica PlayerList.
+
+        Args:
+            player_list (PlayerList): The replica to update.
+        """
+
+        if self.kind is EventKind.INSERTED and self.anchor is not None:
+            player_list.insert_after(player_list.get(self.anchor),
+                                     PlayerNode(Player(self.key, self.name)))
+        elif self.kind is EventKind.INSERTED:
+            player_list.insert(self.index, PlayerNode(Player(self.key, self.name)))
+        elif self.kind is EventKind.REMOVED:
+            player_list.remove(self.key)
+        elif self.kind is EventKind.CLEARED:
+            player_list.clear()
+        elif self.kind is EventKind.REORDERED:
+            positions = {key: i for i, key in enumerate(self.order)}
+            player_list.sort(key=lambda node: positions[node.key])
+        else:
+            player_list.move(self.key, self.index)
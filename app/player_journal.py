@@ -0,0 +1,373 @@
+# player_journal.py
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+
+from app.player import Player
+from app.player_list import PlayerList
+from app.player_node import PlayerNode
+
+def _encode_key(key):
+    """
+    Converts a key to JSON that decodes back to an equal key.
+    """
+
+    if isinstance(key, uuid.UUID):
+        return {"uuid": str(key)}
+
+    return key
+
+def _decode_key(value):
+    """
+    Converts an encoded key back to the original key.
+    """
+
+    if isinstance(value, dict):
+        return uuid.UUID(value["uuid"])
+
+    return value
+
+class PlayerJournal:
+    """
+    An append-only write-ahead journal of PlayerList mutations.
+
+    Records are buffered and written with a single fsync per group
+    commit, either when the commit interval has passed or the batch is
+    full.  A timer commits records still buffered when the interval
+    ends, so an idle journal reaches disk too.  The journal can be
+    compacted into a snapshot of the list, and a list can be rebuilt by
+    replaying the snapshot and journal tail.
+
+    Notes:
+        Keys must be str, int or uuid.UUID instances so that a replayed
+        list has the same keys, a list with this journal attached
+        rejects other keys on insert.
+    """
+
+    OPS = ("push", "append", "insert", "shift", "pop", "remove", "move", "clear",
+           "insert_after", "sort")
+
+    KEY_TYPES = (str, int, uuid.UUID)
+
+    def __init__(self, path: str, snapshot_path: str = None,
+                 commit_interval: float = 0.05, max_batch: int = 1024,
+                 compact_every: int = None):
+        """
+        Open (or create) a journal.
+
+        Args:
+            path (str):
+                The journal file, records are appended to it.
+            snapshot_path (str):
+                The snapshot file written by compact(), defaults to the
+                journal path with a ".snapshot" suffix.
+            commit_interval (float):
+                Seconds a record may stay buffered before it is
+                committed, 0 commits every record.
+            max_batch (int):
+                Commit early when this many records are buffered.
+            compact_every (int):
+                Optional number of records after which the attached list
+                is compacted into a new snapshot.
+        """
+
+        self._path = path
+        self._snapshot_path = snapshot_path or f"{path}.snapshot"
+        self._commit_interval = commit_interval
+        self._max_batch = max_batch
+        self._compact_every = compact_every
+
+        self._buffer = []
+        self._lock = threading.RLock()          # The timer commits from its own thread
+        self._timer = None
+        self._player_list = None
+        self._replaying = False
+        self._since_compact = 0
+        self._seq = max(self._read_snapshot()[0], self._recover())
+
+        self._file = open(path, "a", encoding="utf-8")
+        self._last_commit = time.monotonic()
+
+    @property
+    def seq(self) -> int:
+        """
+        Get the sequence number of the last record.
+
+        Returns:
+            int: The sequence number, 0 if nothing was recorded.
+        """
+
+        return self._seq
+
+    def attach(self, player_list):
+        """
+        Attach the PlayerList that records come from, it is the list
+        written out by compact().
+        """
+
+        self._player_list = player_list
+
+    def check_key(self, key):
+        """
+        Check that a key can be recorded and replayed as an equal key.
+
+        Raises:
+            ValueError if the key is not a str, int or uuid.UUID.
+        """
+
+        if not isinstance(key, self.KEY_TYPES) or isinstance(key, bool):
+            raise ValueError(f"Journal cannot record a key of type {type(key).__name__}!")
+
+    def record(self, op: str, node: PlayerNode = None, index: int = None,
+               anchor: PlayerNode = None, order: list = None):
+        """
+        Buffer a mutation record, committing the batch when it is due or
+        starting a timer to commit it when the interval ends.
+
+        Args:
+            op (str): One of PlayerJournal.OPS
+            node (PlayerNode): The node inserted, or removed by key.
+            index (int): The index for insert and move records.
+            anchor (PlayerNode): The node an insert_after follows.
+            order (list): The keys in list order after a sort.
+        """
+
+        if self._replaying:
+            return
+
+        with self._lock:
+            self._seq += 1
+            record = {"seq": self._seq, "op": op}
+
+            if op == "insert" or op == "move":
+                record["index"] = index
+
+            if anchor is not None:
+                record["anchor"] = _encode_key(anchor.key)
+
+            if order is not None:
+                record["order"] = [_encode_key(key) for key in order]
+
+            if node is not None and op != "shift" and op != "pop":
+                record["uid"] = _encode_key(node.key)
+                if op != "remove" and op != "move":
+                    record["name"] = node.player.name
+
+            self._buffer.append(json.dumps(record) + "\n")
+            self._since_compact += 1
+
+            remaining = self._commit_interval - (time.monotonic() - self._last_commit)
+
+            if len(self._buffer) >= self._max_batch or remaining <= 0:
+                self.commit()
+            elif self._timer is None:
+                self._timer = threading.Timer(remaining, self._commit_due)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if (self._compact_every is not None and self._player_list is not None and
+                self._since_compact >= self._compact_every):
+            self.compact()
+
+    def commit(self):
+        """
+        Write buffered records and fsync the journal.
+        """
+
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            if self._buffer:
+                self._file.writelines(self._buffer)
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                logging.debug(f"Committed {len(self._buffer)} journal records")
+                self._buffer.clear()
+
+            self._last_commit = time.monotonic()
+
+    def compact(self):
+        """
+        Write a snapshot of the attached list and truncate the journal.
+
+        The snapshot records the last sequence number it covers, so a
+        crash between writing it and truncating the journal only leaves
+        records that replay will skip.
+
+        Raises:
+            RuntimeError if no list is attached.
+        """
+
+        if self._player_list is None:
+            raise RuntimeError("No PlayerList attached to the journal!")
+
+        with self._lock:
+            self.commit()
+
+            temp_path = f"{self._snapshot_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as snapshot:
+                snapshot.write(json.dumps({"seq": self._seq}) + "\n")
+                snapshot.writelines(json.dumps([_encode_key(node.key), node.player.name]) + "\n"
+                                    for node in self._player_list)
+                snapshot.flush()
+                os.fsync(snapshot.fileno())
+
+            os.replace(temp_path, self._snapshot_path)
+
+            self._file.truncate(0)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._since_compact = 0
+
+        logging.debug(f"Compacted journal at seq {self._seq}")
+
+    def replay(self, **list_args):
+        """
+        Rebuild a PlayerList from the snapshot and the journal tail, the
+        rebuilt list is attached to this journal.
+
+        Args:
+            **list_args: Passed on to the PlayerList constructor.
+
+        Returns:
+            PlayerList: The rebuilt list.
+        """
+
+        self.commit()
+        snapshot_seq, rows = self._read_snapshot()
+
+        self._replaying = True
+        try:
+            player_list = PlayerList(journal=self, **list_args)
+
+            for uid, name in rows:
+                player_list.append(PlayerNode(Player(_decode_key(uid), name)))
+
+            for record in self._read_records():
+                if record["seq"] > snapshot_seq:
+                    self._apply(player_list, record)
+        finally:
+            self._replaying = False
+
+        return player_list
+
+    def close(self):
+        """
+        Commit any buffered records and close the journal file.
+        """
+
+        with self._lock:
+            if not self._file.closed:
+                self.commit()
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _commit_due(self):
+        """
+        Commits the buffered records when the timer started by record()
+         fires, unless a commit already happened or the journal closed.
+        """
+
+        with self._lock:
+            if self._timer is not None and not self._file.closed:
+                self.commit()
+
+    def _apply(self, player_list, record: dict):
+        """
+        Applies a single journal record to a list.
+        """
+
+        op = record["op"]
+
+        if op == "shift" or op == "pop" or op == "clear":
+            getattr(player_list, op)()
+        elif op == "remove":
+            player_list.remove(_decode_key(record["uid"]))
+        elif op == "move":
+            player_list.move(_decode_key(record["uid"]), record["index"])
+        elif op == "sort":
+            positions = {_decode_key(uid): i for i, uid in enumerate(record["order"])}
+            player_list.sort(key=lambda node: positions[node.key])
+        else:
+            new_node = PlayerNode(Player(_decode_key(record["uid"]), record["name"]))
+
+            if op == "insert_after":
+                player_list.insert_after(player_list.get(_decode_key(record["anchor"])), new_node)
+            elif op == "insert":
+                player_list.insert(record["index"], new_node)
+            else:
+                getattr(player_list, op)(new_node)
+
+    def _recover(self) -> int:
+        """
+        Truncates a torn record left at the end of the journal by a
+         crash mid-write, so new records are not appended after it.
+
+        Returns:
+            int: The sequence number of the last whole record.
+        """
+
+        if not os.path.exists(self._path):
+            return 0
+
+        seq = 0
+        good_bytes = 0
+
+        with open(self._path, "rb") as journal:
+            for line in journal:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("Record is missing its line ending")
+                    seq = json.loads(line)["seq"]
+                except ValueError:
+                    break
+                good_bytes += len(line)
+
+        if good_bytes < os.path.getsize(self._path):
+            logging.warning(f"Truncating torn journal records after seq {seq}")
+            os.truncate(self._path, good_bytes)
+
+        return seq
+
+    def _read_snapshot(self):
+        """
+        Reads the snapshot file.
+
+        Returns:
+            tuple: The sequence number covered and a list of
+             [uid, name] rows, (0, []) if there is no snapshot.
+        """
+
+        if not os.path.exists(self._snapshot_path):
+            return 0, []
+
+        with open(self._snapshot_path, encoding="utf-8") as snapshot:
+            header = json.loads(snapshot.readline())
+            return header["seq"], [json.loads(line) for line in snapshot]
+
+    def _read_records(self):
+        """
+        Yields the records in the journal file, stopping at a torn
+         record left by a crash mid-write.
+        """
+
+        if not os.path.exists(self._path):
+            return
+
+        with open(self._path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logging.warning(f"Ignoring torn journal record: {line!r}")
+                    return
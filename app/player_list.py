@@ -1,6 +1,12 @@
 # player_list.py
+import heapq
 import logging
+import random
 
+from app import roster_loader
+from app.eviction_policy import EvictionPolicy
+from app.player import Player
+from app.player_event import EventKind, PlayerEvent
 from app.player_node import PlayerNode
 
 class PlayerList:
@@ -8,9 +14,65 @@ class PlayerList:
     A Double-Linked List implementation for a list of Player instaces.
     """
 
-    def __init__(self):
+    def __init__(self, maxlen: int = None,
+                 policy: EvictionPolicy = EvictionPolicy.DROP_OLDEST,
+                 on_evict=None, journal=None, weak_links: bool = False,
+                 index: bool = True, membership_filter=None):
+        """
+        Initialize an empty list.
+
+        Args:
+            maxlen (int):
+                Optional maximum number of nodes in the list, defaults
+                to unbounded.
+            policy (EvictionPolicy):
+                What to do when an insert would exceed maxlen, defaults
+                to dropping the oldest node at the tail.
+            on_evict (callable):
+                Optional callback, called with each evicted PlayerNode.
+            journal (PlayerJournal):
+                Optional write-ahead journal that records mutations,
+                keys it cannot record are rejected on insert.
+            weak_links (bool):
+                Link each node to its previous node with a weak
+                reference, so the chain has no reference cycles and is
+                freed by reference counting instead of the garbage
+                collector.
+            index (bool):
+                Keep a key -> node index, defaults to True.  Without it
+                key lookups and duplicate checks scan the list, the
+                node handle methods stay O(1) as each node records the
+                list holding it.
+            membership_filter (CuckooFilter):
+                Optional probabilistic filter of the keys in the list,
+                checked before a key lookup or duplicate check so the
+                exact check (a scan without an index) only runs on a
+                filter hit.  Must start empty.
+
+        Raises:
+            ValueError if maxlen is less than 1
+        """
+
+        if maxlen is not None and maxlen < 1:
+            raise ValueError("Maximum length must be at least 1!")
+
         self._head = None
         self._tail = None
+        self._nodes = {} if index else None     # key -> PlayerNode index
+        self._filter = membership_filter
+        self._size = 0
+        self._maxlen = maxlen
+        self._policy = EvictionPolicy(policy)
+        self._on_evict = on_evict
+        self._weak_links = weak_links
+        self._journal = journal
+        self._subscribers = []
+        self._pending_events = []
+        self._pool = None                       # Nodes in arbitrary order, for sampling
+        self._pool_positions = None             # key -> position in the pool
+
+        if journal is not None:
+            journal.attach(self)
 
         logging.basicConfig(level=logging.INFO)
 
@@ -37,6 +99,27 @@ class PlayerList:
 
         return self._tail
 
+    @property
+    def maxlen(self):
+        """
+        Get the maximum length of the list.
+
+        Returns:
+            int: The maximum number of nodes *OR None* if unbounded.
+        """
+
+        return self._maxlen
+
+    def is_full(self):
+        """
+        Checks if the list is at its maximum length.
+
+        Returns:
+            True if the list is bounded and full, otherwise False.
+        """
+
+        return self._maxlen is not None and self._size >= self._maxlen
+
     def is_empty(self):
         """
         Checks if the list is empty.
@@ -55,9 +138,14 @@ class PlayerList:
             new_node(PlayerNode): 
                 The PlayerNode instance to insert at head of list.
 
+        Returns:
+            PlayerNode: The node evicted to make room *OR None*.
+
         Raises:
             ValueError when node is None
 
+            IndexError when the list is full and rejects inserts
+
         """
 
         if new_node is None:
@@ -66,14 +154,20 @@ class PlayerList:
         if not self._check_for_dupes(new_node):
             raise ValueError(f"Player or PlayerNode with ID: {new_node.key} already exists in the list!")
 
+        evicted = self._make_room()
+
         if self.is_empty():
             self._head = new_node
             self._tail = new_node
         else:
             self._insert_at_head(new_node)
 
+        self._register(new_node)
+        self._record("push", new_node)
         logging.debug(f"Inserted at HEAD of list: {new_node}")
 
+        return evicted
+
     def insert(self, index: int, new_node: PlayerNode):
         """
         Insert a new node to the list with the given index.
@@ -91,6 +185,9 @@ class PlayerList:
 
             new_node(PlayerNode): 
                 The PlayerNode instance to insert at head of list.
+
+        Returns:
+            PlayerNode: The node evicted to make room *OR None*.
         """
 
         if new_node is None:
@@ -98,21 +195,24 @@ class PlayerList:
 
         if not self._check_for_dupes(new_node):
             raise ValueError(f"Player or PlayerNode with ID: {new_node.key} already exists in the list!")
+
+        # Check the index value is valid for other additions
+        if not self.is_empty() and index not in (0, -1):
+            raise RuntimeError(f"Adding internal nodes not yet supported")
+
+        evicted = self._make_room()
         
         if self.is_empty():                             
             self._head = new_node
             self._tail = new_node
-            return                                      
-        
-        if index == 0:
+        elif index == 0:
             self._insert_at_head(new_node)
-            return
-        elif index == -1:
+        else:
             self._insert_at_tail(new_node)
-            return
 
-        # Check the index value is valid for other additions
-        raise RuntimeError(f"Adding internal nodes not yet supported")
+        self._register(new_node)
+        self._record("insert", new_node, index)
+        return evicted
 
     def append(self, new_node: PlayerNode):
         """
@@ -122,8 +222,13 @@ class PlayerList:
             new_node(PlayerNode): 
                 The PlayerNode instance to insert at tail of list.
 
+        Returns:
+            PlayerNode: The node evicted to make room *OR None*.
+
         Raises:
             ValueError if new node is None
+
+            IndexError when the list is full and rejects inserts
         """
 
         if new_node is None:
@@ -132,6 +237,8 @@ class PlayerList:
         if not self._check_for_dupes(new_node):
             raise ValueError(f"Player or PlayerNode with ID: {new_node.key} already exists in the list!")
 
+        evicted = self._make_room()
+
         if self.is_empty():
             self._head = new_node
             self._tail = new_node
@@ -139,8 +246,12 @@ class PlayerList:
         else:
             self._insert_at_tail(new_node)
 
+        self._register(new_node)
+        self._record("append", new_node)
         logging.debug(f"Inserted at TAIL of list: {new_node}")
 
+        return evicted
+
     def shift(self) -> PlayerNode:
         """
         Remove the Head node from the list.
@@ -161,6 +272,8 @@ class PlayerList:
         else:
             self._tail = None
 
+        self._unregister(removing)
+        self._record("shift", removing)
         logging.debug(f"Removed from HEAD of list: {removing}")
 
         del removing.next
@@ -186,6 +299,8 @@ class PlayerList:
         else:
             self._head = None
         
+        self._unregister(removing)
+        self._record("pop", removing)
         logging.debug(f"Removed from TAIL of list: {removing}")
         
         del removing.previous
@@ -201,32 +316,464 @@ class PlayerList:
             *OR None* if the key was not found.
         """
 
-        current = self._head
+        current = self._find(key)
 
-        while current is not None:
-            if current.key is not key:
-                current = current.next
-                continue
+        if current is None:
+            return None
+
+        self._unlink(current)
+        self._unregister(current)
+        self._record("remove", current)
+        logging.debug(f"Removed: {current}")
+
+        return current
+
+    def insert_after(self, node: PlayerNode, new_node: PlayerNode):
+        """
+        Insert a new node directly after a node already in the list,
+        without a traversal.
+
+        Args:
+            node (PlayerNode): A node in this list.
+            new_node (PlayerNode): The unlinked PlayerNode to insert.
+
+        Returns:
+            PlayerNode: The node evicted to make room *OR None*.
+
+        Raises:
+            ValueError if the node is not in this list, or the new node
+             is None, a duplicate or linked to other nodes.
+        """
+
+        self._check_member(node)
+        return self._insert_linked(new_node, node)
+
+    def insert_before(self, node: PlayerNode, new_node: PlayerNode):
+        """
+        Insert a new node directly before a node already in the list,
+        without a traversal.
+
+        Args:
+            node (PlayerNode): A node in this list.
+            new_node (PlayerNode): The unlinked PlayerNode to insert.
+
+        Returns:
+            PlayerNode: The node evicted to make room *OR None*.
+
+        Raises:
+            ValueError if the node is not in this list, or the new node
+             is None, a duplicate or linked to other nodes.
+        """
+
+        self._check_member(node)
+        return self._insert_linked(new_node, node.previous)
+
+    def remove_node(self, node: PlayerNode) -> PlayerNode:
+        """
+        Remove a node already in the list, without a traversal.
+
+        Returns:
+            PlayerNode: The node that was removed.
+
+        Raises:
+            ValueError if the node is not in this list.
+        """
+
+        self._check_member(node)
+
+        self._unlink(node)
+        self._unregister(node)
+        self._record("remove", node)
+        logging.debug(f"Removed: {node}")
+
+        return node
+
+    def replace(self, node: PlayerNode, new_node: PlayerNode) -> PlayerNode:
+        """
+        Replace a node already in the list with a new node, in the same
+        position and without a traversal.  The new node may have the
+        same key as the node it replaces.
+
+        Returns:
+            PlayerNode: The node that was replaced.
+
+        Raises:
+            ValueError if the node is not in this list, or the new node
+             is None, a duplicate or linked to other nodes.
+        """
+
+        self._check_member(node)
+
+        if new_node is None:
+            raise ValueError("PlayerNode argument was empty or invalid!")
+
+        if new_node.key != node.key and not self._check_for_dupes(new_node):
+            raise ValueError(f"Player or PlayerNode with ID: {new_node.key} already exists in the list!")
+
+        if new_node.previous or new_node.next:
+            raise ValueError("New node should not be connected to other nodes")
+
+        previous = node.previous
+
+        self.remove_node(node)
+        self._link_after(new_node, previous)
+        self._register(new_node)
+        self._record_link(new_node, previous)
+        logging.debug(f"Replaced {node} with {new_node}")
+
+        return node
+
+    def get(self, key: str) -> PlayerNode:
+        """
+        Get a node by key, from the index.
+
+        Returns:
+            PlayerNode: The node with the key *OR None* if not found.
+        """
+
+        return self._find(key)
+
+    def move(self, key: str, index: int):
+        """
+        Move a node by key to the head or tail of the list.
+
+        Args:
+            key (str):
+                The key of the node to move.
+            index (int):
+                - A value of 0 will move the node to the head of the list.
+                - A value of -1 will move the node to the tail of the list.
+
+        Returns:
+            PlayerNode: The node that was moved.
+
+        Raises:
+            KeyError if no node with the key is in the list.
+        """
+
+        if index not in (0, -1):
+            raise RuntimeError(f"Moving to internal positions not yet supported")
+
+        current = self._find(key)
+
+        if current is None:
+            raise KeyError(f"No Player or PlayerNode with ID: {key} in the list!")
+
+        if current is (self._head if index == 0 else self._tail):
+            return current                      # Already in place
+
+        self._unlink(current)
+
+        if index == 0:
+            self._insert_at_head(current)
+        else:
+            self._insert_at_tail(current)
+
+        self._record("move", current, index)
+        logging.debug(f"Moved: {current}")
+
+        return current
+
+    def sort(self, key=None, reverse: bool = False):
+        """
+        Sort the list in place by relinking the existing nodes.  The
+        nodes are ordered with Python's stable merge sort (Timsort) over
+        a temporary list of references, so the sort is O(n log n), no
+        nodes are created and the index is unchanged.
+
+        Args:
+            key (callable):
+                Function of a PlayerNode returning the value to sort by,
+                defaults to the node key.  For example sorting by name
+                is key=lambda node: node.player.name
+            reverse (bool):
+                Sort in descending order, nodes with equal values keep
+                their order.
+        """
+
+        if self._size < 2:
+            return
+
+        # Timsort over references to the nodes, then relink them in order
+        nodes = sorted(self, key=key or (lambda node: node.key), reverse=reverse)
+        head = nodes[0]
+        tail = nodes[-1]
+
+        del head.previous
+        del tail.next
 
-            # Handle removal...
-            if current.previous:
-                current.previous.next = current.next
+        for previous, node in zip(nodes, nodes[1:]):
+            previous.next = node
+            node.link_previous(previous, self._weak_links)
 
-            elif current == self._head:
-                self._head = current.next
+        self._head = head
+        self._tail = tail
 
-            if current.next:
-                current.next.previous = current.previous
+        if self._journal is not None or self._subscribers:
+            self._record("sort", order=[node.key for node in nodes])
 
-            elif current == self._tail:
-                self._tail = current.previous
+        logging.debug("Sorted list")
 
+    def clear(self):
+        """
+        Remove every node from the list.
+
+        Every released node is unlinked in one pass, so clearing is O(n)
+        but the nodes can be inserted again, and strongly linked nodes
+        are not left as reference cycles for the garbage collector.
+        """
+
+        head = self._head
+
+        self._head = None
+        self._tail = None
+        self._size = 0
+
+        if self._nodes is not None:
+            self._nodes = {}
+
+        if self._filter is not None:
+            self._filter.clear()
+
+        self._pool = None
+        self._pool_positions = None
+
+        current = head
+        while current is not None:
+            following = current.next
             del current.previous
             del current.next
-            logging.debug(f"Removed: {current}")
-            break
+            del current.owner
+            current = following
 
-        return current
+        self._record("clear")
+        logging.debug("Cleared list")
+
+    def subscribe(self, callback):
+        """
+        Subscribe to batches of mutation events.
+
+        Args:
+            callback (callable):
+                Called by flush() with a list of PlayerEvent instances,
+                in the order the mutations happened.
+        """
+
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """
+        Stop delivering events to a subscriber.
+
+        Raises:
+            ValueError if the callback is not subscribed.
+        """
+
+        self._subscribers.remove(callback)
+
+        if not self._subscribers:
+            self._pending_events.clear()
+
+    def flush(self) -> int:
+        """
+        Deliver the events collected since the last flush to every
+        subscriber as a single batch.
+
+        Returns:
+            int: The number of events in the batch.
+        """
+
+        if not self._pending_events:
+            return 0
+
+        batch = self._pending_events
+        self._pending_events = []
+
+        for callback in self._subscribers:
+            callback(batch)
+
+        return len(batch)
+
+    def load_stream(self, path: str, format: str = None,
+                    chunk_size: int = roster_loader.DEFAULT_CHUNK_SIZE,
+                    workers: int = None, progress=None) -> int:
+        """
+        Append the players in a CSV or JSONL roster file, in file order.
+
+        The file is read in large chunks that are parsed in a process
+        pool, with a bounded number of chunks in memory at a time.
+        Players already in the list, or repeated in the file, are
+        skipped.
+
+        Args:
+            path (str):
+                The roster file of (uid, name) rows.
+            format (str):
+                "csv" or "jsonl", defaults to the file extension.
+            chunk_size (int):
+                The approximate size of each chunk in bytes.
+            workers (int):
+                The number of parsing processes, defaults to the CPU
+                count.  0 parses in this process.
+            progress (callable):
+                Optional callback, called after each chunk with the bytes
+                read, the total bytes and the number of players loaded.
+
+        Returns:
+            int: The number of players loaded.
+
+        Raises:
+            ValueError if the format is not supported or a row is
+             malformed.
+        """
+
+        loaded = 0
+
+        for rows, bytes_read, total in roster_loader.parse_stream(
+                path, format, chunk_size, workers):
+            for uid, name in rows:
+                if self._find(uid) is not None:
+                    continue                    # Duplicate uid, skip it
+
+                self.append(PlayerNode(Player(uid, name)))
+                loaded += 1
+
+            if progress is not None:
+                progress(bytes_read, total, loaded)
+
+        logging.debug(f"Loaded {loaded} players from {path}")
+
+        return loaded
+
+    def sample(self, k: int, weight=None, max_weight: float = 1.0,
+               seed: int = None) -> list:
+        """
+        Choose k distinct nodes at random, without copying the list.
+
+        Sampling uses a pool of the nodes that is built on first use and
+        kept up to date by every insert and removal after that, so each
+        sample costs O(k).
+
+        Args:
+            k (int):
+                The number of nodes to choose.
+            weight (callable):
+                Optional function of a PlayerNode returning its weight,
+                between 0 and max_weight.  Nodes are accepted by
+                rejection sampling, falling back to an exact weighted
+                pass over the pool when too many are rejected.
+            max_weight (float):
+                The largest weight the weight function returns.
+            seed (int):
+                Optional seed for a reproducible sample.
+
+        Returns:
+            list[PlayerNode]: The chosen nodes.
+
+        Raises:
+            ValueError if k is negative or larger than the list, or
+             fewer than k nodes have a positive weight.
+        """
+
+        if not 0 <= k <= self._size:
+            raise ValueError(f"Sample size {k} is out of range for a list of {self._size}!")
+
+        rng = random.Random(seed)
+        pool = self._sample_pool()
+
+        if weight is None:
+            return [pool[i] for i in rng.sample(range(len(pool)), k)]
+
+        chosen = {}
+
+        for _ in range(32 * k + 64):
+            if len(chosen) == k:
+                break
+
+            node = pool[rng.randrange(len(pool))]
+            if node.key not in chosen and rng.random() * max_weight < weight(node):
+                chosen[node.key] = node
+
+        if len(chosen) < k:
+            # Too many rejections, weights are far below max_weight
+            remaining = k - len(chosen)
+            candidates = []
+            for node in pool:
+                node_weight = weight(node)
+                if node.key not in chosen and node_weight > 0:
+                    candidates.append((rng.random() ** (1 / node_weight), node))
+
+            if len(candidates) < remaining:
+                raise ValueError(f"Fewer than {k} nodes have a positive weight!")
+
+            for _, node in heapq.nlargest(remaining, candidates, key=lambda c: c[0]):
+                chosen[node.key] = node
+
+        return list(chosen.values())
+
+    def sample_window(self, key: str, radius: int, k: int = None,
+                      seed: int = None) -> list:
+        """
+        Get the nodes within radius positions of a node, or choose k of
+        them at random.  The node itself is not included.
+
+        Args:
+            key (str):
+                The key of the node at the centre of the window.
+            radius (int):
+                The number of positions to look either side of the node.
+            k (int):
+                Optional number of nodes to choose from the window,
+                defaults to the whole window.
+            seed (int):
+                Optional seed for a reproducible sample.
+
+        Returns:
+            list[PlayerNode]: The nodes in list order, or the chosen
+             nodes when k is given.
+
+        Raises:
+            KeyError if no node with the key is in the list.
+        """
+
+        before = self.iter_from(key, reverse=True)
+        after = self.iter_from(key)
+        next(before)                            # Skip the centre node
+        next(after)
+
+        window = [node for node, _ in zip(before, range(radius))]
+        window.reverse()
+        window.extend(node for node, _ in zip(after, range(radius)))
+
+        if k is None:
+            return window
+
+        return random.Random(seed).sample(window, min(k, len(window)))
+
+    def iter_from(self, key: str, reverse: bool = False):
+        """
+        Iterate the list starting at the node with the given key, the
+        starting node is found through the index rather than a scan
+        (unless the list has no index).
+
+        Args:
+            key (str):
+                The key of the node to start from, it is the first node
+                yielded.
+            reverse (bool):
+                Defaults to walking towards the tail, set reverse = True
+                to walk towards the head.
+
+        Raises:
+            KeyError if no node with the key is in the list.
+        """
+
+        current = self._find(key)
+
+        if current is None:
+            raise KeyError(f"No Player or PlayerNode with ID: {key} in the list!")
+
+        return self._walk(current, reverse)
 
     def display(self, reverse: bool = False):
         """
@@ -254,6 +801,45 @@ class PlayerList:
               f"==>\n"
               f"{start_label} \n{nodes_string} \n{end_label}")
 
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        """
+        Get a node by position, or a list of nodes with a slice.  The
+        walk starts from whichever end of the list is closer.
+
+        Args:
+            index (int | slice):
+                The position of the node, negative values count back from
+                the tail. Slices support negative bounds and steps.
+
+        Returns:
+            PlayerNode: The node at the position.
+
+            *OR list[PlayerNode]* for a slice.
+
+        Raises:
+            IndexError if an int index is out of range.
+        """
+
+        if isinstance(index, slice):
+            positions = range(*index.indices(self._size))
+            if not positions:
+                return []
+
+            low = min(positions[0], positions[-1])
+            window = self._window(low, max(positions[0], positions[-1]))
+            return [window[position - low] for position in positions]
+
+        if index < 0:
+            index += self._size
+
+        if not 0 <= index < self._size:
+            raise IndexError("The list index is out of range!")
+
+        return self._window(index, index)[0]
+
     def __iter__(self):
         current = self._head
 
@@ -284,14 +870,283 @@ class PlayerList:
 
     def _check_for_dupes(self, new_node: PlayerNode) -> bool:
         """
-        Checks for duplicate PlayerNodes or Players through the 
-         existing items in the list
+        Checks for duplicate PlayerNodes or Players with the key index,
+         a node, its player and its key all collide on the key.  Without
+         an index the existing items in the list are scanned, but only
+         on a membership filter hit.  Keys the journal cannot record are
+         rejected first.
         """
 
+        if self._journal is not None:
+            self._journal.check_key(new_node.key)
+
+        if self._filter is not None and new_node.key not in self._filter:
+            return True
+
+        if self._nodes is not None:
+            return new_node.key not in self._nodes
+
         # Filter the list with node.equals func to find collisions
-        # return not any(node.equals(new_node) for node in self)
         return not any(filter(new_node.equals, self))
 
+    def _find(self, key) -> PlayerNode:
+        """
+        Looks up a node by key, through the membership filter then the
+         index, or a scan when there is no index.
+
+        Returns:
+            PlayerNode: The node with the key *OR None* if not found.
+        """
+
+        if self._filter is not None and key not in self._filter:
+            return None
+
+        if self._nodes is not None:
+            return self._nodes.get(key)
+
+        return next((node for node in self if node.key == key), None)
+
+    def _make_room(self) -> PlayerNode:
+        """
+        Applies the eviction policy before an insert when the list is
+         full.  Evictions come off either end, so no traversal is needed.
+
+        Returns:
+            PlayerNode: The evicted node *OR None* if there was room.
+        """
+
+        if not self.is_full():
+            return None
+
+        if self._policy is EvictionPolicy.REJECT:
+            raise IndexError(f"The list is full! (maxlen={self._maxlen})")
+
+        if self._policy is EvictionPolicy.DROP_OLDEST:
+            evicted = self.pop()
+        else:
+            evicted = self.shift()
+
+        logging.debug(f"Evicted from list: {evicted}")
+
+        if self._on_evict is not None:
+            self._on_evict(evicted)
+
+        return evicted
+
+    def _register(self, node: PlayerNode):
+        """
+        Adds an inserted node to the index and membership filter, and
+         marks the node as held by this list.
+        """
+
+        node.owner = self
+
+        if self._nodes is not None:
+            self._nodes[node.key] = node
+
+        if self._filter is not None:
+            self._filter.add(node.key)
+
+        if self._pool is not None:
+            self._pool_positions[node.key] = len(self._pool)
+            self._pool.append(node)
+
+        self._size += 1
+
+    def _unregister(self, node: PlayerNode):
+        """
+        Drops a removed node from the index and membership filter.
+        """
+
+        del node.owner
+
+        if self._nodes is not None:
+            del self._nodes[node.key]
+
+        if self._filter is not None:
+            self._filter.discard(node.key)
+
+        if self._pool is not None:
+            # Swap the last node into the removed node's position
+            position = self._pool_positions.pop(node.key)
+            last = self._pool.pop()
+            if last is not node:
+                self._pool[position] = last
+                self._pool_positions[last.key] = position
+
+        self._size -= 1
+
+    def _sample_pool(self) -> list:
+        """
+        Gets the sampling pool, building it from the list on first use.
+        """
+
+        if self._pool is None:
+            self._pool = list(self)
+            self._pool_positions = {node.key: i for i, node in enumerate(self._pool)}
+
+        return self._pool
+
+    def _check_member(self, node: PlayerNode):
+        """
+        Checks that a node is in this list through the list it records,
+         so no lookup or scan is needed.  A node with the same key from
+         another list does not pass.
+        """
+
+        if node is None or node.owner is not self:
+            raise ValueError("PlayerNode is not in this list!")
+
+    def _insert_linked(self, new_node: PlayerNode, previous: PlayerNode) -> PlayerNode:
+        """
+        Validates a new node and links it in directly after previous, or
+         at the head when previous is None.
+
+        Returns:
+            PlayerNode: The node evicted to make room *OR None*.
+        """
+
+        if new_node is None:
+            raise ValueError("PlayerNode argument was empty or invalid!")
+
+        if not self._check_for_dupes(new_node):
+            raise ValueError(f"Player or PlayerNode with ID: {new_node.key} already exists in the list!")
+
+        if new_node.previous or new_node.next:
+            raise ValueError("New node should not be connected to other nodes")
+
+        evicted = self._make_room()
+
+        if evicted is not None and evicted is previous:
+            # The anchor was evicted, take its place at the end it left
+            previous = self._tail if self._policy is EvictionPolicy.DROP_OLDEST else None
+
+        self._link_after(new_node, previous)
+        self._register(new_node)
+        self._record_link(new_node, previous)
+        logging.debug(f"Inserted: {new_node}")
+
+        return evicted
+
+    def _link_after(self, new_node: PlayerNode, previous: PlayerNode):
+        """
+        Links an unlinked node in directly after previous, or at the
+         head when previous is None.  The index is not updated.
+        """
+
+        following = previous.next if previous is not None else self._head
+
+        if previous is None and following is None:
+            self._head = new_node
+            self._tail = new_node
+        elif previous is None:
+            self._insert_at_head(new_node)
+        elif following is None:
+            self._insert_at_tail(new_node)
+        else:
+            new_node.next = following
+            new_node.link_previous(previous, self._weak_links)
+            previous.next = new_node
+            following.link_previous(new_node, self._weak_links)
+
+    def _record_link(self, new_node: PlayerNode, previous: PlayerNode):
+        """
+        Records a node linked in after previous, as a push when it went
+         to the head.
+        """
+
+        if previous is None:
+            self._record("push", new_node)
+        else:
+            self._record("insert_after", new_node, anchor=previous)
+
+    def _record(self, op: str, node: PlayerNode = None, index: int = None,
+                anchor: PlayerNode = None, order: list = None):
+        """
+        Passes a completed mutation on to the journal, if there is one.
+        """
+
+        if self._journal is not None:
+            self._journal.record(op, node, index, anchor, order)
+
+        if not self._subscribers:
+            return                              # No one to collect for
+
+        if op in ("shift", "pop", "remove"):
+            event = PlayerEvent(EventKind.REMOVED, node.key)
+        elif op == "clear":
+            event = PlayerEvent(EventKind.CLEARED, None)
+        elif op == "sort":
+            event = PlayerEvent(EventKind.REORDERED, None, order=tuple(order))
+        elif op == "move":
+            event = PlayerEvent(EventKind.MOVED, node.key, index=index)
+        elif op == "insert_after":
+            event = PlayerEvent(EventKind.INSERTED, node.key, node.player.name,
+                                anchor=anchor.key)
+        else:
+            if op != "insert":
+                index = 0 if op == "push" else -1
+            event = PlayerEvent(EventKind.INSERTED, node.key, node.player.name, index)
+
+        self._pending_events.append(event)
+
+    def _walk(self, current: PlayerNode, reverse: bool = False):
+        """
+        Yields nodes from current towards the tail, or towards the head
+         when reversed.
+        """
+
+        while current is not None:
+            yield current
+            current = current.previous if reverse else current.next
+
+    def _window(self, low: int, high: int) -> list:
+        """
+        Collects the nodes at positions low to high (inclusive), walking
+         in from the closer end of the list.  Positions are not checked.
+        """
+
+        count = high - low + 1
+
+        if low <= self._size - 1 - high:
+            nodes = self._walk(self._head)
+            for _ in range(low):
+                next(nodes)
+            return [next(nodes) for _ in range(count)]
+
+        nodes = self._walk(self._tail, reverse=True)
+        for _ in range(self._size - 1 - high):
+            next(nodes)
+        window = [next(nodes) for _ in range(count)]
+        window.reverse()
+        return window
+
+    def _unlink(self, current: PlayerNode):
+        """
+        Removes a node from the chain, joining its neighbours and
+         clearing its links.  The index is not updated.
+        """
+
+        previous = current.previous
+        following = current.next
+
+        if previous and following:
+            previous.next = following
+        elif previous:
+            del previous.next                   # Removed the tail
+        else:
+            self._head = following
+
+        if following and previous:
+            following.link_previous(previous, self._weak_links)
+        elif following:
+            del following.previous              # Removed the head
+        else:
+            self._tail = previous
+
+        del current.previous
+        del current.next
+
     def _insert_at_head(self, new_node: PlayerNode):
         """
         Inserting when the list is not empty...
@@ -307,7 +1162,7 @@ class PlayerList:
             raise ValueError("New node should not be connected to other nodes")
 
         new_node.next = current_head        # Connect the new head
-        current_head.previous = new_node
+        current_head.link_previous(new_node, self._weak_links)
 
         self._head = new_node               # Update the head ref
     
@@ -325,7 +1180,7 @@ class PlayerList:
         if new_node.next:
             raise ValueError("New node should not be connect to other nodes")
 
-        new_node.previous = current_tail    # Connect the new tail
+        new_node.link_previous(current_tail, self._weak_links)    # Connect the new tail
         current_tail.next = new_node
 
         self._tail = new_node               # Update the tail ref
\ No newline at end of file
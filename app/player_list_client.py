@@ -0,0 +1,287 @@
+# player_list_client.py
+import queue
+import socket
+import threading
+
+from contextlib import contextmanager
+
+from app import player_list_protocol as protocol
+
+class _Connection:
+    """
+    A socket to the server with buffered reads.
+    """
+
+    def __init__(self, address):
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        self.sock.connect(address)
+
+        if family != socket.AF_UNIX:
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self.rfile = self.sock.makefile("rb")
+
+    def close(self):
+        self.rfile.close()
+        self.sock.close()
+
+class Pipeline:
+    """
+    Queues commands for a PlayerListClient and sends them together.
+
+    execute() splits the commands into batches, writes every batch
+    without waiting, then reads the results back, so a long pipeline
+    costs one round trip rather than one per command.
+    """
+
+    def __init__(self, client, batch_size: int = 1024):
+        self._client = client
+        self._batch_size = min(batch_size, protocol.MAX_BATCH)
+        self._commands = []
+
+    def push(self, list_name: str, uid: str, name: str):
+        self._commands.append((protocol.PUSH, list_name, uid, name))
+        return self
+
+    def append(self, list_name: str, uid: str, name: str):
+        self._commands.append((protocol.APPEND, list_name, uid, name))
+        return self
+
+    def shift(self, list_name: str):
+        self._commands.append((protocol.SHIFT, list_name, None, None))
+        return self
+
+    def pop(self, list_name: str):
+        self._commands.append((protocol.POP, list_name, None, None))
+        return self
+
+    def remove(self, list_name: str, uid: str):
+        self._commands.append((protocol.REMOVE, list_name, uid, None))
+        return self
+
+    def get(self, list_name: str, uid: str):
+        self._commands.append((protocol.GET, list_name, uid, None))
+        return self
+
+    def execute(self) -> list:
+        """
+        Send the queued commands and clear the pipeline.
+
+        Returns:
+            list: A result per command, in order.  A (uid, name) tuple
+             for a removed or found player, None for inserts and keys
+             that were not found, or the ValueError / IndexError the
+             command raised on the server.
+        """
+
+        commands = self._commands
+        self._commands = []
+
+        batches = [commands[i:i + self._batch_size]
+                   for i in range(0, len(commands), self._batch_size)]
+
+        return self._client._send(batches)
+
+    def __len__(self):
+        return len(self._commands)
+
+class PlayerListClient:
+    """
+    A client for PlayerListServer, with a pool of connections shared by
+    the threads of a worker process.
+    """
+
+    def __init__(self, address, pool_size: int = 4):
+        """
+        Args:
+            address (str | tuple):
+                The server's Unix socket path, or (host, port) for TCP.
+            pool_size (int):
+                The most connections kept open, they are opened on
+                demand.
+        """
+
+        self._address = address
+        self._idle = queue.LifoQueue()
+        self._available = threading.BoundedSemaphore(pool_size)
+
+    def pipeline(self, batch_size: int = 1024) -> Pipeline:
+        """
+        Start a pipeline of commands.
+
+        Returns:
+            Pipeline: Queue commands on it, then call execute().
+        """
+
+        return Pipeline(self, batch_size)
+
+    def push(self, list_name: str, uid: str, name: str):
+        """
+        Insert a player at the head of a hosted list.
+
+        Raises:
+            ValueError if the player is already in the list, or a string
+             is too long for the protocol.
+        """
+
+        self._single(protocol.PUSH, list_name, uid, name)
+
+    def append(self, list_name: str, uid: str, name: str):
+        """
+        Insert a player at the tail of a hosted list.
+
+        Raises:
+            ValueError if the player is already in the list, or a string
+             is too long for the protocol.
+        """
+
+        self._single(protocol.APPEND, list_name, uid, name)
+
+    def shift(self, list_name: str) -> tuple:
+        """
+        Remove the player at the head of a hosted list.
+
+        Returns:
+            tuple: The (uid, name) of the removed player.
+
+        Raises:
+            IndexError if the list is empty.
+        """
+
+        return self._single(protocol.SHIFT, list_name)
+
+    def pop(self, list_name: str) -> tuple:
+        """
+        Remove the player at the tail of a hosted list.
+
+        Returns:
+            tuple: The (uid, name) of the removed player.
+
+        Raises:
+            IndexError if the list is empty.
+        """
+
+        return self._single(protocol.POP, list_name)
+
+    def remove(self, list_name: str, uid: str) -> tuple:
+        """
+        Remove a player by uid from a hosted list.
+
+        Returns:
+            tuple: The (uid, name) of the removed player *OR None*.
+        """
+
+        return self._single(protocol.REMOVE, list_name, uid)
+
+    def get(self, list_name: str, uid: str) -> tuple:
+        """
+        Get a player by uid from a hosted list.
+
+        Returns:
+            tuple: The (uid, name) of the player *OR None*.
+        """
+
+        return self._single(protocol.GET, list_name, uid)
+
+    def close(self):
+        """
+        Close the idle connections in the pool.
+        """
+
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return
+
+            connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _single(self, op: int, list_name: str, uid: str = None, name: str = None):
+        """
+        Sends one command and raises its error, if any.
+        """
+
+        (result,) = self._send([[(op, list_name, uid, name)]])
+
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+    def _send(self, batches) -> list:
+        """
+        Writes every batch on one connection, then reads the results.
+         Several batches are written from another thread while results
+         are read, so neither side can block on a full socket buffer.
+        """
+
+        data = b"".join(protocol.frame(protocol.encode_commands(batch)) for batch in batches)
+
+        with self._connection() as connection:
+            if len(batches) > 1:
+                sender = threading.Thread(target=connection.sock.sendall, args=(data,))
+                sender.start()
+            else:
+                sender = None
+                connection.sock.sendall(data)
+
+            results = []
+            for _ in batches:
+                payload = protocol.read_frame(connection.rfile)
+                if payload is None:
+                    raise ConnectionError("Server closed the connection!")
+
+                results.extend(self._result(*result)
+                               for result in protocol.decode_results(payload))
+
+            if sender is not None:
+                sender.join()
+
+        return results
+
+    def _result(self, status: int, uid: str, name: str):
+        """
+        Converts a protocol result into a client result.
+        """
+
+        if status == protocol.STATUS_VALUE_ERROR or status == protocol.STATUS_BAD_REQUEST:
+            return ValueError(name)
+        if status == protocol.STATUS_INDEX_ERROR:
+            return IndexError(name)
+        if status == protocol.STATUS_NONE or not uid:
+            return None
+
+        return uid, name
+
+    @contextmanager
+    def _connection(self):
+        """
+        Borrows a connection from the pool, waiting while pool_size are
+         in use and opening one when none are idle.  A connection that
+         fails is closed rather than returned.
+        """
+
+        self._available.acquire()
+
+        try:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                connection = _Connection(self._address)
+
+            try:
+                yield connection
+            except BaseException:
+                connection.close()
+                raise
+
+            self._idle.put(connection)
+        finally:
+            self._available.release()
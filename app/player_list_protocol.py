@@ -0,0 +1,194 @@
+# player_list_protocol.py
+"""
+The binary protocol spoken between PlayerListServer and
+PlayerListClient.
+
+Every message is a frame, a 4 byte big-endian payload length followed
+by the payload.  A request payload is a batch of commands and the
+response payload has one result per command, in the same order.
+
+    request:  count:H  { op:B  list:B-string  uid:H-string  name:H-string }
+    response: count:H  { status:B  uid:H-string  name:H-string }
+
+Strings are UTF-8 with a length prefix of the given size, so a list
+name is at most 255 bytes and a uid or name at most 65535 bytes.
+Unused fields are empty strings, and an error result carries its
+message in the name field.
+"""
+
+import struct
+
+PUSH = 1
+APPEND = 2
+SHIFT = 3
+POP = 4
+REMOVE = 5
+GET = 6
+
+OPS = (PUSH, APPEND, SHIFT, POP, REMOVE, GET)
+
+STATUS_OK = 0                   # With a player, or empty for inserts
+STATUS_NONE = 1                 # Key not found
+STATUS_VALUE_ERROR = 2
+STATUS_INDEX_ERROR = 3
+STATUS_BAD_REQUEST = 4          # Unknown op
+
+MAX_BATCH = 0xFFFF
+MAX_STRING = 0xFFFF
+
+_LENGTH = struct.Struct("!I")
+_COUNT = struct.Struct("!H")
+_BYTE = struct.Struct("!B")
+
+def _pack_string(value: str, prefix: struct.Struct) -> bytes:
+    data = value.encode("utf-8")
+    limit = (1 << (8 * prefix.size)) - 1
+
+    if len(data) > limit:
+        raise ValueError(f"String of {len(data)} bytes is longer than the {limit} byte limit!")
+
+    return prefix.pack(len(data)) + data
+
+def _unpack_string(payload: bytes, offset: int, prefix: struct.Struct):
+    (length,) = prefix.unpack_from(payload, offset)
+    offset += prefix.size
+
+    if offset + length > len(payload):
+        raise ValueError("String runs past the end of the payload!")
+
+    return payload[offset:offset + length].decode("utf-8"), offset + length
+
+def _check_end(payload: bytes, offset: int):
+    if offset != len(payload):
+        raise ValueError(f"{len(payload) - offset} unexpected bytes after the last item!")
+
+def frame(payload: bytes) -> bytes:
+    """
+    Prefix a payload with its length.
+    """
+
+    return _LENGTH.pack(len(payload)) + payload
+
+def read_frame(rfile) -> bytes:
+    """
+    Read one frame from a buffered binary file.
+
+    Returns:
+        bytes: The payload *OR None* if the stream ended.
+
+    Raises:
+        ConnectionError if the stream ends mid-frame.
+    """
+
+    header = rfile.read(_LENGTH.size)
+    if not header:
+        return None
+
+    if len(header) < _LENGTH.size:
+        raise ConnectionError("Connection closed mid-frame!")
+
+    (length,) = _LENGTH.unpack(header)
+    payload = rfile.read(length)
+
+    if len(payload) < length:
+        raise ConnectionError("Connection closed mid-frame!")
+
+    return payload
+
+def encode_commands(commands) -> bytes:
+    """
+    Encode a batch of (op, list name, uid, name) commands as a payload.
+
+    Raises:
+        ValueError if the batch is too large, an op is unknown or a
+         string is too long.
+    """
+
+    if len(commands) > MAX_BATCH:
+        raise ValueError(f"Batches are limited to {MAX_BATCH} commands!")
+
+    parts = [_COUNT.pack(len(commands))]
+
+    for op, list_name, uid, name in commands:
+        if op not in OPS:
+            raise ValueError(f"Unknown command op: {op}")
+
+        parts.append(_BYTE.pack(op))
+        parts.append(_pack_string(list_name, _BYTE))
+        parts.append(_pack_string(uid or "", _COUNT))
+        parts.append(_pack_string(name or "", _COUNT))
+
+    return b"".join(parts)
+
+def decode_commands(payload: bytes) -> list:
+    """
+    Decode a request payload.
+
+    Returns:
+        list[tuple]: The (op, list name, uid, name) commands.  Ops are
+         not checked, the server answers an unknown op with an error.
+
+    Raises:
+        ValueError if the payload is malformed.
+    """
+
+    try:
+        (count,) = _COUNT.unpack_from(payload)
+        offset = _COUNT.size
+        commands = []
+
+        for _ in range(count):
+            (op,) = _BYTE.unpack_from(payload, offset)
+            list_name, offset = _unpack_string(payload, offset + _BYTE.size, _BYTE)
+            uid, offset = _unpack_string(payload, offset, _COUNT)
+            name, offset = _unpack_string(payload, offset, _COUNT)
+            commands.append((op, list_name, uid, name))
+    except struct.error as e:
+        raise ValueError(f"Truncated payload: {e}") from e
+
+    _check_end(payload, offset)
+    return commands
+
+def encode_results(results) -> bytes:
+    """
+    Encode a batch of (status, uid, name) results as a payload.
+
+    Raises:
+        ValueError if a string is too long.
+    """
+
+    parts = [_COUNT.pack(len(results))]
+
+    for status, uid, name in results:
+        parts.append(_BYTE.pack(status))
+        parts.append(_pack_string(uid or "", _COUNT))
+        parts.append(_pack_string(name or "", _COUNT))
+
+    return b"".join(parts)
+
+def decode_results(payload: bytes) -> list:
+    """
+    Decode a response payload.
+
+    Returns:
+        list[tuple]: The (status, uid, name) results.
+
+    Raises:
+        ValueError if the payload is malformed.
+    """
+
+    try:
+        (count,) = _COUNT.unpack_from(payload)
+        offset = _COUNT.size
+        results = []
+
+        for _ in range(count):
+            (status,) = _BYTE.unpack_from(payload, offset)
+            uid, offset = _unpack_string(payload, offset + _BYTE.size, _COUNT)
+            name, offset = _unpack_string(payload, offset, _COUNT)
+            results.append((status, uid, name))
+    except struct.error as e:
+        raise ValueError(f"Truncated payload: {e}") from e
+
+    _check_end(payload, offset)
+    return results
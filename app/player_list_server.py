@@ -0,0 +1,214 @@
+# player_list_server.py
+import logging
+import os
+import socket
+import socketserver
+import threading
+
+from app import player_list_protocol as protocol
+from app.player import Player
+from app.player_list import PlayerList
+from app.player_node import PlayerNode
+
+def _message(error: Exception) -> str:
+    """
+    Gets an error message short enough to fit a result, a message that
+    quotes a long uid could otherwise not be encoded.
+    """
+
+    data = str(error).encode("utf-8")[:protocol.MAX_STRING]
+    return data.decode("utf-8", errors="ignore")
+
+class _PlayerListHandler(socketserver.StreamRequestHandler):
+    """
+    Serves one client connection.  Frames are handled in the order they
+    arrive, so a client may pipeline several before reading results.
+    """
+
+    def setup(self):
+        super().setup()
+
+        if self.connection.family != socket.AF_UNIX:
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        while True:
+            try:
+                payload = protocol.read_frame(self.rfile)
+                if payload is None:
+                    return
+
+                commands = protocol.decode_commands(payload)
+            except (ConnectionError, ValueError) as e:
+                # The stream can't be trusted to line up with frames now
+                logging.warning(f"Closing connection from {self.client_address!r}: {e}")
+                return
+
+            results = self.server.execute(commands)
+            self.wfile.write(protocol.frame(protocol.encode_results(results)))
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+class PlayerListServer:
+    """
+    Hosts named PlayerList instances for local worker processes, over a
+    Unix socket or a localhost TCP socket.
+
+    Lists are created on first use.  Each batch of commands runs under a
+    single lock, so a batch is applied atomically.
+    """
+
+    def __init__(self, address, list_factory=PlayerList):
+        """
+        Bind the server, it does not accept connections until started.
+
+        Args:
+            address (str | tuple):
+                A Unix socket path, or a (host, port) tuple for TCP.
+                Port 0 picks a free port.
+            list_factory (callable):
+                Creates the PlayerList for a new list name.
+        """
+
+        self._list_factory = list_factory
+        self._lists = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+        if isinstance(address, str):
+            if os.path.exists(address):
+                os.unlink(address)
+            server_class = _UnixServer
+        else:
+            server_class = _TCPServer
+
+        self._server = server_class(address, _PlayerListHandler)
+        self._server.execute = self.execute     # Used by the handlers
+
+        logging.basicConfig(level=logging.INFO)
+
+    @property
+    def address(self):
+        """
+        Get the bound address, with the real port for TCP.
+
+        Returns:
+            str | tuple: The address clients should connect to.
+        """
+
+        return self._server.server_address
+
+    def player_list(self, name: str) -> PlayerList:
+        """
+        Get a hosted list by name, creating it if needed.
+
+        Returns:
+            PlayerList: The list.
+        """
+
+        player_list = self._lists.get(name)
+
+        if player_list is None:
+            player_list = self._lists.setdefault(name, self._list_factory())
+
+        return player_list
+
+    def execute(self, commands) -> list:
+        """
+        Apply a batch of (op, list name, uid, name) commands.
+
+        Returns:
+            list[tuple]: A (status, uid, name) result per command.
+        """
+
+        results = []
+
+        with self._lock:
+            for op, list_name, uid, name in commands:
+                results.append(self._execute(self.player_list(list_name), op, uid, name))
+
+        return results
+
+    def serve_forever(self):
+        """
+        Serve clients until close() is called.
+        """
+
+        self._server.serve_forever()
+
+    def start(self):
+        """
+        Serve clients on a background thread.
+
+        Returns:
+            PlayerListServer: This server.
+        """
+
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+        return self
+
+    def close(self):
+        """
+        Stop serving and release the socket.
+        """
+
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+
+        self._server.server_close()
+
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.unlink(self.address)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _execute(self, player_list: PlayerList, op: int, uid: str, name: str):
+        """
+        Applies a single command to a list.
+        """
+
+        if op not in protocol.OPS:
+            return protocol.STATUS_BAD_REQUEST, None, f"Unknown command op: {op}"
+
+        try:
+            if op == protocol.PUSH or op == protocol.APPEND:
+                node = PlayerNode(Player(uid, name))
+
+                if op == protocol.PUSH:
+                    player_list.push(node)
+                else:
+                    player_list.append(node)
+
+                return protocol.STATUS_OK, None, None
+
+            if op == protocol.SHIFT:
+                node = player_list.shift()
+            elif op == protocol.POP:
+                node = player_list.pop()
+            elif op == protocol.REMOVE:
+                node = player_list.remove(uid)
+            else:
+                node = player_list.get(uid)
+
+        except ValueError as e:
+            return protocol.STATUS_VALUE_ERROR, None, _message(e)
+        except IndexError as e:
+            return protocol.STATUS_INDEX_ERROR, None, _message(e)
+
+        if node is None:
+            return protocol.STATUS_NONE, None, None
+
+        return protocol.STATUS_OK, str(node.key), node.player.name
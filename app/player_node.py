@@ -1,4 +1,5 @@
 # player_node.py
+import weakref
 
 from app.player import Player
 
@@ -28,6 +29,7 @@ class PlayerNode:
         self._player = player
         self._prev_player = None
         self._next_player = None
+        self._owner = None
 
     @property
     def previous(self):
@@ -39,7 +41,12 @@ class PlayerNode:
             OR None if at the head of the node sequence.
         """
 
-        return self._prev_player
+        previous = self._prev_player
+
+        if type(previous) is weakref.ref:
+            return previous()                   # None if it was collected
+
+        return previous
 
     @previous.setter
     def previous(self, player_node):
@@ -61,10 +68,31 @@ class PlayerNode:
             Intended to be used in a Doubly Linked List structure. 
         """
 
+        self.link_previous(player_node)
+
+    def link_previous(self, player_node, weak: bool = False):
+        """
+        Set the linked PlayerNode before this node, optionally with a
+        weak reference.
+
+        Args:
+            player_node (PlayerNode): The PlayerNode to be linked as the
+             previous node. Must not be None.
+            weak (bool): Hold the previous node with a weak reference,
+             so the pair of links does not form a reference cycle.
+
+        Raises:
+            ValueError: If the node argument is None.
+
+        Notes:
+            A weakly linked previous node reads as None once nothing
+             else references it.
+        """
+
         if player_node is None:
             raise ValueError("Must provide PlayerNode instance!")
-        
-        self._prev_player = player_node
+
+        self._prev_player = weakref.ref(player_node) if weak else player_node
 
     @previous.deleter
     def previous(self):
@@ -117,6 +145,46 @@ class PlayerNode:
 
         self._next_player = None
 
+    @property
+    def owner(self):
+        """
+        Get the list this node was inserted into.
+
+        Returns:
+            PlayerList: The list holding this node
+
+            *Or None* if the node is not in a list.
+        """
+
+        return self._owner() if self._owner is not None else None
+
+    @owner.setter
+    def owner(self, player_list):
+        """
+        Set the list holding this node.
+
+        Args:
+            player_list (PlayerList): The list the node was inserted
+             into.  It is held with a weak reference, so the node does
+             not keep the list alive.
+
+        Raises:
+            ValueError: If the list argument is None.
+        """
+
+        if player_list is None:
+            raise ValueError("Must provide PlayerList instance!")
+
+        self._owner = weakref.ref(player_list)
+
+    @owner.deleter
+    def owner(self):
+        """
+        Clears the reference
+        """
+
+        self._owner = None
+
     @property
     def player(self):
         """
@@ -157,7 +225,7 @@ class PlayerNode:
         current = self._player
         this_player_str = f"{current.uid} ({repr(current.name)})"
         
-        previous = self._prev_player
+        previous = self.previous
         previous_str = "AT HEAD (No prior nodes)"
         if previous is not None:
             previous_str = f"{previous.key} ({repr(previous.player.name)})"
@@ -0,0 +1,195 @@
+# priority_player_list.py
+import logging
+
+from app.player_list import PlayerList
+from app.player_node import PlayerNode
+
+class PriorityPlayerList:
+    """
+    A priority-laned list of Player instances, made of one PlayerList
+    per lane.  Lane 0 has the highest priority.
+
+    A bitmap of non-empty lanes finds the lane to shift from without
+    scanning, and a single key index across all lanes prevents a player
+    from being queued in more than one lane.
+    """
+
+    def __init__(self, lanes: int = 3):
+        """
+        Initialize an empty list.
+
+        Args:
+            lanes (int): The number of priority lanes, at least 1.
+
+        Raises:
+            ValueError if there are no lanes.
+        """
+
+        if lanes < 1:
+            raise ValueError("Must have at least one lane!")
+
+        self._lanes = [PlayerList() for _ in range(lanes)]
+        self._lane_of = {}                      # key -> lane index
+        self._non_empty = 0                     # Bit n set if lane n has nodes
+
+        logging.basicConfig(level=logging.INFO)
+
+    @property
+    def lanes(self) -> int:
+        """
+        Get the number of lanes.
+
+        Returns:
+            int: The number of lanes.
+        """
+
+        return len(self._lanes)
+
+    def lane(self, lane: int) -> PlayerList:
+        """
+        Get the PlayerList for a lane, for reading only.  Mutating it
+        directly bypasses the bitmap and key index.
+
+        Returns:
+            PlayerList: The lane.
+        """
+
+        return self._lanes[self._check_lane(lane)]
+
+    def lane_of(self, key: str) -> int:
+        """
+        Get the lane a player is queued in.
+
+        Returns:
+            int: The lane index *OR None* if the key is not queued.
+        """
+
+        return self._lane_of.get(key)
+
+    def is_empty(self):
+        """
+        Checks if every lane is empty.
+
+        Returns:
+            True if the list is empty, otherwise False.
+        """
+
+        return self._non_empty == 0
+
+    def enqueue(self, new_node: PlayerNode, lane: int):
+        """
+        Add a new node at the tail of a lane.
+
+        Args:
+            new_node(PlayerNode):
+                The PlayerNode instance to queue.
+            lane(int):
+                The lane to queue it in.
+
+        Raises:
+            ValueError if the node is None, already queued in any lane or
+             the lane does not exist.
+        """
+
+        self._check_lane(lane)
+
+        if new_node is None:
+            raise ValueError("PlayerNode argument was empty or invalid!")
+
+        if new_node.key in self._lane_of:
+            raise ValueError(f"Player or PlayerNode with ID: {new_node.key} already exists in the list!")
+
+        self._lanes[lane].append(new_node)
+        self._lane_of[new_node.key] = lane
+        self._non_empty |= 1 << lane
+
+        logging.debug(f"Queued in lane {lane}: {new_node}")
+
+    def shift(self) -> PlayerNode:
+        """
+        Remove the Head node of the highest priority non-empty lane.
+
+        Returns:
+            PlayerNode: The node that was removed.
+        """
+
+        if self.is_empty():
+            raise IndexError("The list is empty!")
+
+        # Lowest set bit is the highest priority non-empty lane
+        lane = (self._non_empty & -self._non_empty).bit_length() - 1
+
+        removing = self._lanes[lane].shift()
+        self._dequeued(removing, lane)
+
+        return removing
+
+    def remove(self, key: str) -> PlayerNode:
+        """
+        Remove a node by key from whichever lane it is in.
+
+        Returns:
+            PlayerNode: The node that was removed
+
+            *OR None* if the key was not found.
+        """
+
+        lane = self._lane_of.get(key)
+
+        if lane is None:
+            return None
+
+        removing = self._lanes[lane].remove(key)
+        self._dequeued(removing, lane)
+
+        return removing
+
+    def move(self, key: str, lane: int) -> PlayerNode:
+        """
+        Move a node by key to the tail of another lane.
+
+        Returns:
+            PlayerNode: The node that was moved.
+
+        Raises:
+            KeyError if no node with the key is queued.
+        """
+
+        self._check_lane(lane)
+
+        if key not in self._lane_of:
+            raise KeyError(f"No Player or PlayerNode with ID: {key} in the list!")
+
+        moving = self.remove(key)
+        self.enqueue(moving, lane)
+
+        return moving
+
+    def __len__(self):
+        return len(self._lane_of)
+
+    def __iter__(self):
+        for lane in self._lanes:
+            yield from lane
+
+    def _check_lane(self, lane: int) -> int:
+        """
+        Checks that a lane index exists.
+        """
+
+        if not 0 <= lane < len(self._lanes):
+            raise ValueError(f"Lane {lane} does not exist!")
+
+        return lane
+
+    def _dequeued(self, node: PlayerNode, lane: int):
+        """
+        Updates the key index and bitmap after a node leaves a lane.
+        """
+
+        del self._lane_of[node.key]
+
+        if self._lanes[lane].is_empty():
+            self._non_empty &= ~(1 << lane)
+
+        logging.debug(f"Dequeued from lane {lane}: {node}")
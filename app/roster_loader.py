@@ -0,0 +1,157 @@
+# roster_loader.py
+import csv
+import io
+import json
+import os
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+FORMATS = ("csv", "jsonl")
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+def _record_end(data: bytes, format: str) -> int:
+    """
+    Finds the end of the last whole record in data, 0 if there is none.
+     A CSV newline inside a quoted field does not end a record, quotes
+     are escaped by doubling so a newline ends one only after an even
+     number of quotes.
+    """
+
+    cut = data.rfind(b"\n") + 1
+
+    if format != "csv":
+        return cut
+
+    quotes = data.count(b'"', 0, cut)
+
+    while cut and quotes % 2:
+        previous = data.rfind(b"\n", 0, cut - 1) + 1
+        quotes -= data.count(b'"', previous, cut)
+        cut = previous
+
+    return cut
+
+def read_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, format: str = "jsonl"):
+    """
+    Reads a file in large buffered chunks that end on a record boundary.
+
+    Args:
+        path (str): The file to read.
+        chunk_size (int): The approximate size of each chunk in bytes.
+        format (str): "csv" or "jsonl".  CSV chunks never end inside a
+         quoted field, so a field may span lines.
+
+    Yields:
+        tuple: The chunk bytes and the number of bytes read so far.
+    """
+
+    bytes_read = 0
+    remainder = b""
+
+    with open(path, "rb", buffering=chunk_size) as roster:
+        while True:
+            data = roster.read(chunk_size)
+            if not data:
+                break
+
+            data = remainder + data
+            cut = _record_end(data, format)
+            remainder = data[cut:]
+            bytes_read += cut
+
+            if cut:
+                yield data[:cut], bytes_read
+
+    if remainder:
+        yield remainder, bytes_read + len(remainder)
+
+def parse_chunk(data: bytes, format: str) -> list:
+    """
+    Parses a chunk of roster records into (uid, name) rows.
+
+    CSV rows are "uid,name", a "uid,name" header row is skipped, and a
+    quoted field may contain newlines.  JSONL rows are objects with
+    "uid" and "name" fields, one per "\n" terminated line.  Blank lines
+    are skipped.  Other line breaking characters, such as U+2028, are
+    kept as part of a value.
+
+    Raises:
+        ValueError if a row is malformed.
+    """
+
+    text = data.decode("utf-8")
+    rows = []
+
+    if format == "csv":
+        for row in csv.reader(io.StringIO(text, newline="")):
+            if not row or row == ["uid", "name"]:
+                continue
+            if len(row) != 2:
+                raise ValueError(f"Malformed roster row: {row!r}")
+            rows.append((row[0], row[1]))
+    else:
+        for line in text.split("\n"):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                rows.append((record["uid"], record["name"]))
+            except (ValueError, KeyError, TypeError):
+                raise ValueError(f"Malformed roster row: {line!r}")
+
+    return rows
+
+def parse_stream(path: str, format: str = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = None):
+    """
+    Parses a roster file chunk by chunk, in file order.
+
+    Chunks are parsed in a process pool with at most two chunks per
+    worker in flight, so memory use is bounded by the chunk size rather
+    than the file size.
+
+    Args:
+        path (str): The roster file.
+        format (str): "csv" or "jsonl", defaults to the file extension.
+        chunk_size (int): The approximate size of each chunk in bytes.
+        workers (int): The number of parsing processes, defaults to the
+         CPU count.  0 parses in this process.
+
+    Yields:
+        tuple: The parsed rows of a chunk, the number of bytes read so
+         far and the total size of the file.
+
+    Raises:
+        ValueError if the format is not supported.
+    """
+
+    if format is None:
+        format = os.path.splitext(path)[1].lstrip(".").lower()
+
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported roster format: {format!r}")
+
+    total = os.path.getsize(path)
+
+    if workers == 0:
+        for data, bytes_read in read_chunks(path, chunk_size, format):
+            yield parse_chunk(data, format), bytes_read, total
+        return
+
+    workers = workers or os.cpu_count() or 1
+    limit = 2 * workers
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+
+        for data, bytes_read in read_chunks(path, chunk_size, format):
+            in_flight.append((pool.submit(parse_chunk, data, format), bytes_read))
+
+            if len(in_flight) >= limit:
+                future, done = in_flight.popleft()
+                yield future.result(), done, total
+
+        while in_flight:
+            future, done = in_flight.popleft()
+            yield future.result(), done, total
@@ -0,0 +1,398 @@
+# unrolled_player_list.py
+import logging
+
+from operator import attrgetter
+
+from app.player_node import PlayerNode
+
+_player = attrgetter("player")
+
+class _PlayerBlock:
+    """
+    A block of an unrolled list, holds a small array of PlayerNode
+    instances and links to the neighbouring blocks.
+    """
+
+    __slots__ = ("nodes", "previous", "next")
+
+    def __init__(self, nodes: list = None):
+        self.nodes = nodes if nodes is not None else []
+        self.previous = None
+        self.next = None
+
+class UnrolledPlayerList:
+    """
+    An Unrolled Doubly-Linked List implementation for a list of Player
+    instances.
+
+    The inserted PlayerNode instances are stored in fixed capacity
+    blocks rather than linked to each other, so iteration walks
+    contiguous arrays and only hops a pointer once per block.  The
+    nodes handed back by head, tail, the remove methods and iteration
+    are the same instances that were inserted.
+
+    Notes:
+        The nodes are not linked, their previous and next are always
+        None, so walking the list from head.next is not supported.
+        Iterate the list instead.
+    """
+
+    DEFAULT_BLOCK_CAPACITY = 64
+
+    def __init__(self, block_capacity: int = DEFAULT_BLOCK_CAPACITY):
+        """
+        Initialize an empty list.
+
+        Args:
+            block_capacity(int):
+                The maximum number of players held by a single block.
+                Must be at least 2.
+
+        Raises:
+            ValueError if the block capacity is less than 2
+        """
+
+        if block_capacity < 2:
+            raise ValueError("Block capacity must be at least 2!")
+
+        self._capacity = block_capacity
+        self._head = None                       # First block
+        self._tail = None                       # Last block
+        self._blocks = {}                       # key -> block holding the node
+        self._size = 0
+
+        logging.basicConfig(level=logging.INFO)
+
+    @property
+    def head(self):
+        """
+        Get the PlayerNode at the head of the list.
+
+        Returns:
+            PlayerNode: The node at the head of the list *OR None* if
+             the list is empty.
+        """
+
+        if self.is_empty():
+            return None
+
+        return self._head.nodes[0]
+
+    @property
+    def tail(self):
+        """
+        Get the PlayerNode at the tail of the list.
+
+        Returns:
+            PlayerNode: The node at the tail of the list *OR None* if
+             the list is empty.
+        """
+
+        if self.is_empty():
+            return None
+
+        return self._tail.nodes[-1]
+
+    def is_empty(self):
+        """
+        Checks if the list is empty.
+
+        Returns:
+            True if the list is empty, otherwise False.
+        """
+
+        return self._head is None
+
+    def push(self, new_node: PlayerNode):
+        """
+        Insert a new node at the head of the list.
+
+        Args:
+            new_node(PlayerNode):
+                The PlayerNode instance to insert at head of list.
+
+        Raises:
+            ValueError when node is None, or is linked to other nodes
+        """
+
+        self._check_new(new_node)
+
+        if self.is_empty():
+            self._start(new_node)
+        else:
+            self._insert_into_block(self._head, 0, new_node)
+
+        logging.debug(f"Inserted at HEAD of list: {new_node}")
+
+    def insert(self, index: int, new_node: PlayerNode):
+        """
+        Insert a new node to the list with the given index.
+
+        Args:
+            index(int):
+                The index for the new node.
+                - A value of 0 will insert to the head of the list.
+                - A value of -1 will insert to the tail of the list.
+
+            new_node(PlayerNode):
+                The PlayerNode instance to insert.
+        """
+
+        if not self.is_empty() and index not in (0, -1):
+            raise RuntimeError(f"Adding internal nodes not yet supported")
+
+        self._check_new(new_node)
+
+        if self.is_empty():
+            self._start(new_node)
+        elif index == 0:
+            self._insert_into_block(self._head, 0, new_node)
+        else:
+            self._insert_into_block(self._tail, len(self._tail.nodes), new_node)
+
+    def append(self, new_node: PlayerNode):
+        """
+        Add a new node at the tail of the list.
+
+        Args:
+            new_node(PlayerNode):
+                The PlayerNode instance to insert at tail of list.
+
+        Raises:
+            ValueError if new node is None, or is linked to other nodes
+        """
+
+        self._check_new(new_node)
+
+        if self.is_empty():
+            self._start(new_node)
+        else:
+            self._insert_into_block(self._tail, len(self._tail.nodes), new_node)
+
+        logging.debug(f"Inserted at TAIL of list: {new_node}")
+
+    def shift(self) -> PlayerNode:
+        """
+        Remove the Head node from the list.
+
+        Returns:
+            PlayerNode: The removed node.
+        """
+
+        if self.is_empty():
+            raise IndexError("The list is empty!")
+
+        removing = self._remove_from_block(self._head, 0)
+        logging.debug(f"Removed from HEAD of list: {removing}")
+
+        return removing
+
+    def pop(self) -> PlayerNode:
+        """
+        Remove the Tail node from the list.
+
+        Returns:
+            PlayerNode: The removed node.
+        """
+
+        if self.is_empty():
+            raise IndexError("The list is empty!")
+
+        removing = self._remove_from_block(self._tail, len(self._tail.nodes) - 1)
+        logging.debug(f"Removed from TAIL of list: {removing}")
+
+        return removing
+
+    def remove(self, key: str) -> PlayerNode:
+        """
+        Remove a node by key.
+
+        Returns:
+            PlayerNode: The removed node *OR None* if the key was not
+             found.
+        """
+
+        block = self._blocks.get(key)
+
+        if block is None:
+            return None
+
+        for i, node in enumerate(block.nodes):
+            if node.key == key:
+                removing = self._remove_from_block(block, i)
+                logging.debug(f"Removed: {removing}")
+                return removing
+
+        return None
+
+    def display(self, reverse: bool = False):
+        """
+        Prints the list from head to tail, or tail to head.
+
+        Args:
+            reversed (bool):
+                Defaults to descending order (head to tail),
+                set reversed = True to print ascending order (tail to head).
+        """
+
+        if self.is_empty():
+            print("The list is empty!")
+            return
+
+        players = self.players(reverse)
+        nodes_list = [f"> {player.name:<20} [{player.uid}]" for player in players]
+
+        start_label = "<TAIL>" if reverse else "<HEAD>"
+        end_label = "<HEAD>" if reverse else "<TAIL>"
+        nodes_string = '\n'.join(nodes_list)
+
+        print(f"<== Player list"
+              f"{' (Reversed) ' if reverse else ' '}"
+              f"==>\n"
+              f"{start_label} \n{nodes_string} \n{end_label}")
+
+    def players(self, reverse: bool = False):
+        """
+        Iterate the Player instances in the list.
+
+        Args:
+            reverse (bool):
+                Defaults to head to tail, set reverse = True to iterate
+                from tail to head.
+
+        Yields:
+            Player: The players in list order.
+        """
+
+        if reverse:
+            block = self._tail
+            while block is not None:
+                yield from map(_player, reversed(block.nodes))
+                block = block.previous
+        else:
+            block = self._head
+            while block is not None:
+                yield from map(_player, block.nodes)
+                block = block.next
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        block = self._head
+        while block is not None:
+            yield from block.nodes
+            block = block.next
+
+    def __reversed__(self):
+        block = self._tail
+        while block is not None:
+            yield from reversed(block.nodes)
+            block = block.previous
+
+    def _check_new(self, new_node: PlayerNode):
+        """
+        Validates a node for insert.  The key is registered when the
+         node is placed in a block.
+        """
+
+        if new_node is None:
+            raise ValueError("PlayerNode argument was empty or invalid!")
+
+        if new_node.key in self._blocks:
+            raise ValueError(f"Player or PlayerNode with ID: {new_node.key} already exists in the list!")
+
+        if new_node.previous or new_node.next:
+            raise ValueError("New node should not be connected to other nodes")
+
+        self._size += 1
+
+    def _start(self, node: PlayerNode):
+        """
+        Creates the first block when inserting to an empty list.
+        """
+
+        block = _PlayerBlock([node])
+        self._head = block
+        self._tail = block
+        self._blocks[node.key] = block
+
+    def _insert_into_block(self, block: _PlayerBlock, index: int, node: PlayerNode):
+        """
+        Inserts a node into a block, splitting the block in half when it
+        is already at capacity.
+        """
+
+        if len(block.nodes) >= self._capacity:
+            half = len(block.nodes) // 2
+            sibling = _PlayerBlock(block.nodes[half:])
+            del block.nodes[half:]
+
+            for moved in sibling.nodes:
+                self._blocks[moved.key] = sibling
+
+            # Link the sibling after the block
+            sibling.previous = block
+            sibling.next = block.next
+            if block.next is not None:
+                block.next.previous = sibling
+            else:
+                self._tail = sibling
+            block.next = sibling
+
+            if index > half:
+                block = sibling
+                index -= half
+
+        block.nodes.insert(index, node)
+        self._blocks[node.key] = block
+
+    def _remove_from_block(self, block: _PlayerBlock, index: int) -> PlayerNode:
+        """
+        Removes a node from a block.  Empty blocks are unlinked, and a
+        block that falls under half capacity is merged with its
+        neighbour when the result fits in a single block.
+
+        Returns:
+            PlayerNode: The removed node.
+        """
+
+        node = block.nodes.pop(index)
+        del self._blocks[node.key]
+        self._size -= 1
+
+        if not block.nodes:
+            self._unlink_block(block)
+        elif len(block.nodes) < self._capacity // 2:
+            # Merge into whichever block comes first, keeping list order
+            if block.next is not None:
+                first, second = block, block.next
+            else:
+                first, second = block.previous, block
+
+            if (first is not None and
+                    len(first.nodes) + len(second.nodes) <= self._capacity):
+                first.nodes.extend(second.nodes)
+                for moved in second.nodes:
+                    self._blocks[moved.key] = first
+                self._unlink_block(second)
+
+        return node
+
+    def _unlink_block(self, block: _PlayerBlock):
+        """
+        Removes a block from the chain of blocks.
+        """
+
+        if block.previous is not None:
+            block.previous.next = block.next
+        else:
+            self._head = block.next
+
+        if block.next is not None:
+            block.next.previous = block.previous
+        else:
+            self._tail = block.previous
+
+        block.previous = None
+        block.next = None
@@ -0,0 +1,68 @@
+# event_bench.py
+"""
+Measures the overhead of PlayerList change-event subscribers, and
+whether a mutation rate of 100k/s is sustainable with them attached.
+
+Usage:
+    python bench/event_bench.py [--ops N] [--flush-every N]
+"""
+
+import argparse
+import sys
+import os
+import time
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.player import Player
+from app.player_node import PlayerNode
+from app.player_list import PlayerList
+
+TARGET_RATE = 100_000
+
+def run(subscribers: int, ops: int, flush_every: int) -> float:
+    """
+    Append then shift half the ops with the given number of (no-op)
+    subscribers, flushing every flush_every mutations.
+    """
+
+    player_list = PlayerList()
+    for _ in range(subscribers):
+        player_list.subscribe(lambda batch: None)
+
+    nodes = [PlayerNode(Player(f"uid-{i}", f"Player {i}")) for i in range(ops // 2)]
+    start = time.perf_counter()
+
+    for i, node in enumerate(nodes, 1):
+        player_list.append(node)
+        if i % flush_every == 0:
+            player_list.flush()
+    for i in range(1, len(nodes) + 1):
+        player_list.shift()
+        if i % flush_every == 0:
+            player_list.flush()
+
+    player_list.flush()
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--flush-every", type=int, default=1_000)
+    args = parser.parse_args()
+
+    baseline = min(run(0, args.ops, args.flush_every) for _ in range(3))
+    print(f"{args.ops} mutations, flush every {args.flush_every}")
+
+    for subscribers in (0, 1, 10):
+        elapsed = run(subscribers, args.ops, args.flush_every)
+        rate = args.ops / elapsed
+        overhead = (elapsed - baseline) / args.ops * 1e6
+
+        print(f"{subscribers:>3} subscribers {rate:12,.0f} ops/s"
+              f" {overhead:8.2f} us/op overhead"
+              f"   {'sustains' if rate >= TARGET_RATE else 'below'} {TARGET_RATE:,}/s")
+
+if __name__ == "__main__":
+    main()
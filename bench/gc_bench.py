@@ -0,0 +1,72 @@
+# gc_bench.py
+"""
+Measures garbage collector pauses after a large PlayerList is dropped,
+with strong previous links, with clear() before the drop, and with
+weak previous links.
+
+Usage:
+    python bench/gc_bench.py [--size N]
+"""
+
+import argparse
+import gc
+import sys
+import os
+import time
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.player import Player
+from app.player_node import PlayerNode
+from app.player_list import PlayerList
+
+def build(size: int, weak_links: bool) -> PlayerList:
+    player_list = PlayerList(weak_links=weak_links)
+    for i in range(size):
+        player_list.append(PlayerNode(Player(f"uid-{i}", f"Player {i}")))
+    return player_list
+
+def measure(size: int, weak_links: bool, clear: bool):
+    """
+    Build a list, drop it, then time a full collection.
+
+    Returns:
+        tuple: Seconds to drop (including clear), seconds for the
+         collection, and the number of objects it collected.
+    """
+
+    gc.disable()
+    player_list = build(size, weak_links)
+    gc.collect()
+
+    start = time.perf_counter()
+    if clear:
+        player_list.clear()
+    del player_list
+    dropped = time.perf_counter() - start
+
+    start = time.perf_counter()
+    collected = gc.collect()
+    pause = time.perf_counter() - start
+    gc.enable()
+
+    return dropped, pause, collected
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{args.size:,} nodes")
+
+    for label, weak_links, clear in (("strong links, drop", False, False),
+                                     ("strong links, clear()", False, True),
+                                     ("weak links, drop", True, False),
+                                     ("weak links, clear()", True, True)):
+        dropped, pause, collected = measure(args.size, weak_links, clear)
+        print(f"{label:<24} drop {dropped * 1e3:9.1f} ms"
+              f"   gc pause {pause * 1e3:9.1f} ms   {collected:>10,} collected")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# journal_bench.py
+"""
+Measures PlayerList mutation throughput with the write-ahead journal
+off, and on with a range of group commit intervals, plus replay time.
+
+Usage:
+    python bench/journal_bench.py [--ops N]
+"""
+
+import argparse
+import sys
+import os
+import tempfile
+import time
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.player import Player
+from app.player_node import PlayerNode
+from app.player_list import PlayerList
+from app.player_journal import PlayerJournal
+
+def run(player_list, ops: int) -> float:
+    """
+    Append then shift half the ops, returns the elapsed seconds.
+    """
+
+    start = time.perf_counter()
+
+    for i in range(ops // 2):
+        player_list.append(PlayerNode(Player(f"uid-{i}", f"Player {i}")))
+    for _ in range(ops // 2):
+        player_list.shift()
+
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ops", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{args.ops} mutations (append then shift)")
+    print(f"{'journal off':<28} {args.ops / run(PlayerList(), args.ops):12,.0f} ops/s")
+
+    for interval in (0, 0.001, 0.01, 0.1):
+        # fsync per record is slow, keep that run short
+        ops = min(args.ops, 2_000) if interval == 0 else args.ops
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "bench.journal")
+
+            with PlayerJournal(path, commit_interval=interval) as journal:
+                elapsed = run(PlayerList(journal=journal), ops)
+
+            with PlayerJournal(path) as journal:
+                start = time.perf_counter()
+                journal.replay()
+                replay = time.perf_counter() - start
+
+        label = f"journal, commit every {interval}s"
+        print(f"{label:<28} {ops / elapsed:12,.0f} ops/s"
+              f"   replay {ops / replay:12,.0f} records/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# membership_bench.py
+"""
+Compares the memory footprint and lookup rate of the cuckoo membership
+filter against a dict index and the full scan duplicate check.
+
+Usage:
+    python bench/membership_bench.py [--size N] [--scan-size N]
+"""
+
+import argparse
+import sys
+import os
+import time
+import tracemalloc
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.cuckoo_filter import CuckooFilter
+from app.player import Player
+from app.player_node import PlayerNode
+from app.player_list import PlayerList
+
+def measure_memory(build):
+    """
+    Returns the object built and the memory it retains in bytes.
+    """
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    built = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return built, after - before
+
+def lookup_rate(contains, keys) -> float:
+    start = time.perf_counter()
+    for key in keys:
+        contains(key)
+    return len(keys) / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--scan-size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    keys = [f"uid-{i}" for i in range(args.size)]
+    nodes = [PlayerNode(Player(key, "Player")) for key in keys]
+    present = keys[:100_000]
+    absent = [f"other-{i}" for i in range(100_000)]
+
+    print(f"{args.size:,} keys (memory excludes the keys and nodes)")
+
+    index, index_bytes = measure_memory(lambda: {node.key: node for node in nodes})
+    print(f"{'dict index':<26} {index_bytes / 2**20:9.1f} MiB"
+          f" {lookup_rate(index.__contains__, present):14,.0f} hits/s"
+          f" {lookup_rate(index.__contains__, absent):14,.0f} misses/s")
+
+    for error_rate in (0.01, 0.001):
+        def build():
+            cuckoo = CuckooFilter(args.size, error_rate)
+            for key in keys:
+                cuckoo.add(key)
+            return cuckoo
+
+        cuckoo, cuckoo_bytes = measure_memory(build)
+        false_positives = sum(key in cuckoo for key in absent) / len(absent)
+        label = f"cuckoo filter ({error_rate:.1%})"
+        print(f"{label:<26} {cuckoo_bytes / 2**20:9.1f} MiB"
+              f" {lookup_rate(cuckoo.__contains__, present):14,.0f} hits/s"
+              f" {lookup_rate(cuckoo.__contains__, absent):14,.0f} misses/s"
+              f"   {false_positives:.3%} false positives")
+
+    # The scan is linear, so time a few scans of a smaller list
+    scan_list = PlayerList(index=False,
+                           membership_filter=CuckooFilter(args.scan_size, 0.001))
+    for node in nodes[:args.scan_size]:
+        scan_list.append(node)
+
+    probe = PlayerNode(Player("missing", "Player"))
+    start = time.perf_counter()
+    for _ in range(3):
+        not any(filter(probe.equals, scan_list))
+    per_scan = (time.perf_counter() - start) / 3 * args.size / args.scan_size
+
+    print(f"{'full scan':<26} {'-':>9}    "
+          f" {1 / per_scan:14,.2f} lookups/s (extrapolated to {args.size:,})")
+
+if __name__ == "__main__":
+    main()
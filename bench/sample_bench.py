@@ -0,0 +1,59 @@
+# sample_bench.py
+"""
+Compares PlayerList.sample and sample_window against copying the list
+with list(player_list) on every matchmaking tick.
+
+Usage:
+    python bench/sample_bench.py [--size N] [--k N] [--ticks N] [--seed N]
+"""
+
+import argparse
+import random
+import sys
+import os
+import time
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.player import Player
+from app.player_node import PlayerNode
+from app.player_list import PlayerList
+
+def per_tick(tick, ticks: int) -> float:
+    start = time.perf_counter()
+    for i in range(ticks):
+        tick(i)
+    return (time.perf_counter() - start) / ticks
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    player_list = PlayerList()
+    for i in range(args.size):
+        player_list.append(PlayerNode(Player(f"uid-{i}", f"Player {i}")))
+
+    player_list.sample(0)                       # Build the pool outside the timings
+    rng = random.Random(args.seed)
+    centre = f"uid-{args.size // 2}"
+
+    rows = [
+        ("list() + random.sample", lambda i: rng.sample(list(player_list), args.k)),
+        ("sample(k)", lambda i: player_list.sample(args.k, seed=args.seed + i)),
+        ("sample(k, weight)", lambda i: player_list.sample(
+            args.k, weight=lambda node: 0.5, seed=args.seed + i)),
+        ("sample_window(key, 50, k)", lambda i: player_list.sample_window(
+            centre, 50, k=args.k, seed=args.seed + i)),
+    ]
+
+    print(f"{args.size:,} players, k={args.k}, seed={args.seed}")
+    for label, tick in rows:
+        print(f"{label:<28} {per_tick(tick, args.ticks) * 1e6:12.1f} us/tick")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# server_bench.py
+"""
+Measures PlayerListServer throughput and p99 request latency with many
+concurrent client processes, for single commands and batched pipelines.
+
+Usage:
+    python bench/server_bench.py [--clients N] [--ops N] [--tcp]
+"""
+
+import argparse
+import multiprocessing
+import sys
+import os
+import tempfile
+import time
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.player_list_client import PlayerListClient
+from app.player_list_server import PlayerListServer
+
+def serve(address, ready):
+    server = PlayerListServer(address)
+    ready.put(server.address)
+    server.serve_forever()
+
+def client(address, worker: int, ops: int, batch: int) -> list:
+    """
+    Append then shift ops players, batch commands per request.
+
+    Returns:
+        list[float]: The latency of each request in seconds.
+    """
+
+    latencies = []
+
+    with PlayerListClient(address, pool_size=1) as player_lists:
+        list_name = f"lobby-{worker % 4}"
+
+        for start in range(0, ops, batch):
+            count = min(batch, ops - start)
+            began = time.perf_counter()
+
+            if batch == 1:
+                if start % 2 == 0:
+                    player_lists.append(list_name, f"uid-{worker}-{start}", "Player")
+                else:
+                    player_lists.shift(list_name)
+            else:
+                pipeline = player_lists.pipeline(batch_size=batch)
+                for i in range(count // 2):
+                    pipeline.append(list_name, f"uid-{worker}-{start + i}", "Player")
+                for _ in range(count - count // 2):
+                    pipeline.shift(list_name)
+                pipeline.execute()
+
+            latencies.append(time.perf_counter() - began)
+
+    return latencies
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=20_000, help="per client")
+    parser.add_argument("--tcp", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        address = ("127.0.0.1", 0) if args.tcp else os.path.join(temp_dir, "bench.sock")
+
+        ready = multiprocessing.Queue()
+        server = multiprocessing.Process(target=serve, args=(address, ready), daemon=True)
+        server.start()
+        address = ready.get()
+        if isinstance(address, list):
+            address = tuple(address)
+
+        print(f"{args.clients} clients x {args.ops:,} ops over "
+              f"{'TCP' if args.tcp else 'Unix socket'}")
+
+        for batch in (1, 16, 256):
+            ops = args.ops if batch > 1 else args.ops // 10
+
+            with multiprocessing.Pool(args.clients) as pool:
+                started = time.perf_counter()
+                runs = pool.starmap(client, [(address, worker, ops, batch)
+                                             for worker in range(args.clients)])
+                elapsed = time.perf_counter() - started
+
+            latencies = sorted(latency for run in runs for latency in run)
+            p99 = latencies[int(len(latencies) * 0.99)]
+
+            print(f"batch {batch:>4}: {args.clients * ops / elapsed:12,.0f} ops/s"
+                  f"   p99 request {p99 * 1e3:8.3f} ms")
+
+        server.terminate()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# sort_bench.py
+"""
+Compares the in-place PlayerList.sort against copying the list into a
+Python list, sorting it and rebuilding a new PlayerList with append.
+
+Usage:
+    python bench/sort_bench.py [--size N] [--scan-size N]
+"""
+
+import argparse
+import random
+import sys
+import os
+import time
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.player import Player
+from app.player_node import PlayerNode
+from app.player_list import PlayerList
+
+def by_name(node):
+    return node.player.name
+
+def build(size: int, **list_args) -> PlayerList:
+    rng = random.Random(size)
+    player_list = PlayerList(**list_args)
+    for i in range(size):
+        player_list.append(PlayerNode(Player(f"uid-{i}", f"Player {rng.random():.8f}")))
+    return player_list
+
+def rebuild(player_list: PlayerList, **list_args) -> PlayerList:
+    """
+    The copy-sort-rebuild path, new nodes appended one by one.
+    """
+
+    rebuilt = PlayerList(**list_args)
+    for node in sorted(player_list, key=by_name):
+        rebuilt.append(PlayerNode(node.player))
+    return rebuilt
+
+def timed(action) -> float:
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--scan-size", type=int, default=5_000,
+                        help="size for the rebuild that scans for duplicates")
+    args = parser.parse_args()
+
+    print(f"Sorting by name")
+
+    for size, list_args, label in (
+            (args.size, {}, "indexed"),
+            (args.scan_size, {"index": False}, "no index, duplicate scan")):
+        player_list = build(size, **list_args)
+        copy_sort = timed(lambda: rebuild(player_list, **list_args))
+        in_place = timed(lambda: player_list.sort(key=by_name))
+
+        print(f"{size:>9,} players ({label}):"
+              f" rebuild {copy_sort * 1e3:10.1f} ms"
+              f"   in place {in_place * 1e3:10.1f} ms")
+
+if __name__ == "__main__":
+    main()
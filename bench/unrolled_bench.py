@@ -0,0 +1,76 @@
+# unrolled_bench.py
+"""
+Compares iteration speed and memory use of the PlayerNode chain in
+PlayerList against the block based UnrolledPlayerList.  Both lists hold
+the same PlayerNode instances, so the memory column includes the nodes
+and shows what each structure adds on top: the links and key index for
+PlayerList, the blocks and key -> block map for UnrolledPlayerList.
+
+Usage:
+    python bench/unrolled_bench.py [--size N] [--block-capacity N]
+"""
+
+import argparse
+import sys
+import os
+import timeit
+import tracemalloc
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.player import Player
+from app.player_node import PlayerNode
+from app.player_list import PlayerList
+from app.unrolled_player_list import UnrolledPlayerList
+
+def build(factory, players):
+    """
+    Build a list from the players and measure the memory it retains.
+    """
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    player_list = factory()
+    for player in players:
+        player_list.append(PlayerNode(player))
+
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return player_list, after - before
+
+def time_iteration(iterable_factory, repeat: int = 5) -> float:
+    """
+    Best time of several full passes over an iterable.
+    """
+
+    return min(timeit.repeat(lambda: sum(1 for _ in iterable_factory()),
+                             number=1, repeat=repeat))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=2_000)
+    parser.add_argument("--block-capacity", type=int,
+                        default=UnrolledPlayerList.DEFAULT_BLOCK_CAPACITY)
+    args = parser.parse_args()
+
+    players = [Player(f"uid-{i}", f"Player {i}") for i in range(args.size)]
+
+    chain, chain_bytes = build(PlayerList, players)
+    unrolled, unrolled_bytes = build(
+        lambda: UnrolledPlayerList(args.block_capacity), players)
+
+    rows = [
+        ("PlayerList __iter__", time_iteration(lambda: chain), chain_bytes),
+        ("UnrolledPlayerList __iter__", time_iteration(lambda: unrolled), unrolled_bytes),
+        ("UnrolledPlayerList players()", time_iteration(unrolled.players), unrolled_bytes),
+    ]
+
+    print(f"{args.size} players, block capacity {args.block_capacity}")
+    for label, seconds, size in rows:
+        print(f"{label:<32} {seconds * 1e3:10.3f} ms {size / 1024:12.1f} KiB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# cuckoo_filter_test.py
+
+import unittest
+
+import sys
+import os
+
+# Add the project directory to sys.path so the file can be run without 
+# running module.
+# Added for convenience to run from VSCode rather than running module
+# or pytest from terminal.
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.cuckoo_filter import CuckooFilter
+
+class TestCuckooFilterBehavior(unittest.TestCase):
+    """
+    Test the behavior of the cuckoo membership filter
+    """
+
+    def test_no_false_negatives(self):
+        """
+        Testing that added keys are always found, and false positives
+        stay near the error rate.
+        """
+
+        print("\nStart Test: Cuckoo filter membership...")
+
+        cuckoo = CuckooFilter(capacity=10_000, error_rate=0.01)
+        for i in range(10_000):
+            cuckoo.add(f"uid-{i}")
+
+        self.assertEqual(len(cuckoo), 10_000)
+        self.assertTrue(all(f"uid-{i}" in cuckoo for i in range(10_000)))
+
+        false_positives = sum(f"other-{i}" in cuckoo for i in range(10_000))
+        self.assertLess(false_positives, 200)
+
+        print(f"False positives: {false_positives} / 10000")
+
+    def test_discard(self):
+        """
+        Testing deletion support.
+        """
+
+        print("\nStart Test: Cuckoo filter discard...")
+
+        cuckoo = CuckooFilter(capacity=1_000)
+        for i in range(1_000):
+            cuckoo.add(i)
+        for i in range(0, 1_000, 2):
+            cuckoo.discard(i)
+
+        self.assertEqual(len(cuckoo), 500)
+        self.assertTrue(all(i in cuckoo for i in range(1, 1_000, 2)))
+
+        cuckoo.clear()
+        self.assertEqual(len(cuckoo), 0)
+        self.assertNotIn(1, cuckoo)
+
+    def test_over_capacity(self):
+        """
+        Testing that keys past capacity are still never lost.
+        """
+
+        print("\nStart Test: Cuckoo filter over capacity...")
+
+        cuckoo = CuckooFilter(capacity=8)
+        for i in range(100):
+            cuckoo.add(i)
+
+        self.assertTrue(all(i in cuckoo for i in range(100)))
+
+        for i in range(100):
+            cuckoo.discard(i)
+
+        self.assertEqual(len(cuckoo), 0)
+
+        with self.assertRaises(ValueError):
+            CuckooFilter(capacity=10, error_rate=1.5)
+
+if __name__ == '__main__':
+    unittest.main()
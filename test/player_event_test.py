@@ -0,0 +1,118 @@
+# player_event_test.py
+
+import unittest
+
+import sys
+import os
+
+# Add the project directory to sys.path so the file can be run without 
+# running module.
+# Added for convenience to run from VSCode rather than running module
+# or pytest from terminal.
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.player import Player
+from app.player_node import PlayerNode
+from app.player_list import PlayerList
+from app.player_event import EventKind, PlayerEvent
+
+class TestPlayerEventBehavior(unittest.TestCase):
+    """
+    Test the PlayerList mutation event stream
+    """
+
+    def setUp(self):
+        """
+        unittest function for setup before each test
+        """
+
+        self.player_list = PlayerList()
+        self.batches = []
+        self.player_list.subscribe(self.batches.append)
+
+    def node(self, i):
+        return PlayerNode(Player(f"uid-{i}", f"Player {i}"))
+
+    def test_events_are_batched_per_flush(self):
+        """
+        Testing that events are collected and delivered on flush.
+        """
+
+        print("\nStart Test: Batched events...")
+
+        self.player_list.append(self.node(0))
+        self.player_list.push(self.node(1))
+        self.player_list.move("uid-0", 0)
+        self.player_list.pop()
+
+        self.assertEqual(self.batches, [])
+        self.assertEqual(self.player_list.flush(), 4)
+        self.assertEqual(self.player_list.flush(), 0)
+
+        self.assertEqual(self.batches, [[
+            PlayerEvent(EventKind.INSERTED, "uid-0", "Player 0", -1),
+            PlayerEvent(EventKind.INSERTED, "uid-1", "Player 1", 0),
+            PlayerEvent(EventKind.MOVED, "uid-0", index=0),
+            PlayerEvent(EventKind.REMOVED, "uid-1"),
+        ]])
+
+        print("Test success!")
+
+    def test_replica_applies_deltas(self):
+        """
+        Testing that a replica kept in sync with events matches the
+        source list.
+        """
+
+        print("\nStart Test: Replica from events...")
+
+        replica = PlayerList()
+        self.player_list.unsubscribe(self.batches.append)
+        self.player_list.subscribe(lambda batch: [event.apply(replica) for event in batch])
+
+        for i in range(5):
+            self.player_list.append(self.node(i))
+        self.player_list.flush()
+
+        self.player_list.insert(0, self.node(5))
+        self.player_list.shift()
+        self.player_list.remove("uid-2")
+        self.player_list.move("uid-4", 0)
+        self.player_list.move("uid-0", -1)
+        self.player_list.flush()
+
+        self.player_list.clear()
+        self.player_list.append(self.node(6))
+        self.player_list.append(self.node(3))
+        self.player_list.insert_after(self.player_list.get("uid-6"), self.node(7))
+        self.player_list.insert_before(self.player_list.get("uid-6"), self.node(8))
+        self.player_list.replace(self.player_list.get("uid-7"), self.node(9))
+        self.player_list.sort(key=lambda node: node.player.name, reverse=True)
+        self.player_list.flush()
+
+        self.assertEqual([node.key for node in replica],
+                         [node.key for node in self.player_list])
+
+        print("Test success!")
+
+    def test_evictions_are_removals(self):
+        """
+        Testing that evictions from a bounded list emit removals.
+        """
+
+        print("\nStart Test: Eviction events...")
+
+        bounded = PlayerList(maxlen=1)
+        bounded.subscribe(self.batches.append)
+        bounded.append(self.node(0))
+        bounded.append(self.node(1))
+        bounded.flush()
+
+        self.assertEqual([event.kind for event in self.batches[0]],
+                         [EventKind.INSERTED, EventKind.REMOVED, EventKind.INSERTED])
+
+        print("Test success!")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+# player_journal_test.py
+
+import unittest
+import tempfile
+import time
+import uuid
+
+import sys
+import os
+
+# Add the project directory to sys.path so the file can be run without 
+# running module.
+# Added for convenience to run from VSCode rather than running module
+# or pytest from terminal.
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.player import Player
+from app.player_node import PlayerNode
+from app.player_list import PlayerList
+from app.player_journal import PlayerJournal
+
+class TestPlayerJournalBehavior(unittest.TestCase):
+    """
+    Test the behavior of the PlayerList write-ahead journal
+    """
+
+    def setUp(self):
+        """
+        unittest function for setup before each test
+        """
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "lobby.journal")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def node(self, i):
+        return PlayerNode(Player(f"uid-{i}", f"Player {i}"))
+
+    def keys(self, player_list):
+        return [node.key for node in player_list]
+
+    def mutate(self, player_list):
+        for i in range(6):
+            player_list.append(self.node(i))
+        player_list.push(self.node(6))
+        player_list.insert(-1, self.node(7))
+        player_list.shift()
+        player_list.pop()
+        player_list.remove("uid-3")
+        player_list.move("uid-1", -1)
+        player_list.clear()
+        player_list.append(self.node(8))
+        player_list.append(self.node(1))
+        player_list.insert_after(player_list.get("uid-8"), self.node(10))
+        player_list.insert_before(player_list.get("uid-8"), self.node(11))
+        player_list.replace(player_list.get("uid-10"), self.node(12))
+        player_list.sort(key=lambda node: node.player.name, reverse=True)
+
+    def test_replay_rebuilds_list(self):
+        """
+        Testing that replaying the journal rebuilds the same list.
+        """
+
+        print("\nStart Test: Replay journal...")
+
+        with PlayerJournal(self.path, commit_interval=60) as journal:
+            player_list = PlayerList(journal=journal)
+            self.mutate(player_list)
+            expected = self.keys(player_list)
+
+        with PlayerJournal(self.path) as journal:
+            self.assertEqual(journal.seq, 20)
+            replayed = journal.replay()
+            self.assertEqual(self.keys(replayed), expected)
+
+            # The replayed list keeps journaling
+            replayed.append(self.node(9))
+
+        with PlayerJournal(self.path) as journal:
+            self.assertEqual(self.keys(journal.replay()), expected + ["uid-9"])
+
+        print("Test success!")
+
+    def test_group_commit(self):
+        """
+        Testing that records are buffered until the batch is committed.
+        """
+
+        print("\nStart Test: Group commit...")
+
+        journal = PlayerJournal(self.path, commit_interval=60, max_batch=3)
+        player_list = PlayerList(journal=journal)
+
+        player_list.append(self.node(0))
+        player_list.append(self.node(1))
+        self.assertEqual(os.path.getsize(self.path), 0)
+
+        player_list.append(self.node(2))            # Batch is full
+        with open(self.path) as journal_file:
+            self.assertEqual(len(journal_file.readlines()), 3)
+
+        player_list.append(self.node(3))
+        journal.close()
+        with open(self.path) as journal_file:
+            self.assertEqual(len(journal_file.readlines()), 4)
+
+        print("Test success!")
+
+    def test_idle_journal_commits_after_interval(self):
+        """
+        Testing that buffered records reach disk without another
+        mutation once the commit interval ends.
+        """
+
+        print("\nStart Test: Idle journal commit...")
+
+        with PlayerJournal(self.path, commit_interval=0.05) as journal:
+            player_list = PlayerList(journal=journal)
+            player_list.append(self.node(0))
+            player_list.append(self.node(1))
+            self.assertEqual(os.path.getsize(self.path), 0)
+
+            deadline = time.monotonic() + 2
+            while os.path.getsize(self.path) == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            with open(self.path) as journal_file:
+                self.assertEqual(len(journal_file.readlines()), 2)
+
+        print("Test success!")
+
+    def test_replay_keeps_key_types(self):
+        """
+        Testing that UUID and int keys replay as the same keys, and
+        that keys the journal cannot record are rejected.
+        """
+
+        print("\nStart Test: Replay key types...")
+
+        uid = uuid.uuid4()
+
+        with PlayerJournal(self.path, commit_interval=0, compact_every=3) as journal:
+            player_list = PlayerList(journal=journal)
+            player_list.append(PlayerNode(Player(uid, "Uuid")))
+            player_list.append(PlayerNode(Player(7, "Int")))
+            player_list.append(PlayerNode(Player("7", "Str")))    # Compacted
+            player_list.move(uid, -1)
+
+            with self.assertRaises(ValueError):
+                player_list.append(PlayerNode(Player(("a", 1), "Tuple")))
+            self.assertEqual(len(player_list), 3)
+
+        with PlayerJournal(self.path) as journal:
+            replayed = journal.replay()
+
+        self.assertEqual(self.keys(replayed), [7, "7", uid])
+        self.assertEqual(replayed.get(uid).player.name, "Uuid")
+
+        with self.assertRaises(ValueError):
+            replayed.append(PlayerNode(Player(uid, "Duplicate")))
+
+        print("Test success!")
+
+    def test_compaction(self):
+        """
+        Testing that compaction snapshots the list and truncates the
+        journal.
+        """
+
+        print("\nStart Test: Journal compaction...")
+
+        with PlayerJournal(self.path, commit_interval=0, compact_every=5) as journal:
+            player_list = PlayerList(journal=journal)
+            self.mutate(player_list)
+            expected = self.keys(player_list)
+
+        with open(self.path) as journal_file:
+            self.assertEqual(len(journal_file.readlines()), 0)    # 20 records, 4 compactions
+
+        with PlayerJournal(self.path) as journal:
+            self.assertEqual(self.keys(journal.replay()), expected)
+
+        print("Test success!")
+
+    def test_torn_record_is_truncated(self):
+        """
+        Testing recovery from a record torn by a crash mid-write.
+        """
+
+        print("\nStart Test: Torn journal record...")
+
+        with PlayerJournal(self.path, commit_interval=0) as journal:
+            player_list = PlayerList(journal=journal)
+            player_list.append(self.node(0))
+
+        with open(self.path, "a") as journal_file:
+            journal_file.write('{"seq": 2, "op": "app')
+
+        with PlayerJournal(self.path) as journal:
+            self.assertEqual(journal.seq, 1)
+            player_list = journal.replay()
+            player_list.append(self.node(1))
+
+        with PlayerJournal(self.path) as journal:
+            self.assertEqual(self.keys(journal.replay()), ["uid-0", "uid-1"])
+
+        print("Test success!")
+
+if __name__ == '__main__':
+    unittest.main()
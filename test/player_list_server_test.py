@@ -0,0 +1,179 @@
+# player_list_server_test.py
+
+import unittest
+import socket
+import tempfile
+import threading
+
+import sys
+import os
+
+# Add the project directory to sys.path so the file can be run without 
+# running module.
+# Added for convenience to run from VSCode rather than running module
+# or pytest from terminal.
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import player_list_protocol as protocol
+from app.player_list_client import PlayerListClient
+from app.player_list_server import PlayerListServer
+
+class TestPlayerListServerBehavior(unittest.TestCase):
+    """
+    Test the PlayerList server and client over a Unix socket
+    """
+
+    def setUp(self):
+        """
+        unittest function for setup before each test
+        """
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.server = PlayerListServer(os.path.join(self.temp_dir.name, "lobby.sock")).start()
+        self.client = PlayerListClient(self.server.address, pool_size=2)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.close()
+        self.temp_dir.cleanup()
+
+    def test_commands(self):
+        """
+        Testing single commands against a hosted list.
+        """
+
+        print("\nStart Test: Server commands...")
+
+        self.client.append("lobby", "uid-1", "John Wick")
+        self.client.append("lobby", "uid-2", "Iosef Tarasov")
+        self.client.push("lobby", "uid-0", "Viggo Tarasov")
+
+        self.assertEqual(self.client.get("lobby", "uid-1"), ("uid-1", "John Wick"))
+        self.assertIsNone(self.client.get("lobby", "uid-9"))
+        self.assertEqual(self.client.shift("lobby"), ("uid-0", "Viggo Tarasov"))
+        self.assertEqual(self.client.pop("lobby"), ("uid-2", "Iosef Tarasov"))
+        self.assertEqual(self.client.remove("lobby", "uid-1"), ("uid-1", "John Wick"))
+        self.assertIsNone(self.client.remove("lobby", "uid-1"))
+
+        with self.assertRaises(IndexError):
+            self.client.shift("lobby")
+
+        self.client.append("lobby", "uid-1", "John Wick")
+        with self.assertRaises(ValueError):
+            self.client.push("lobby", "uid-1", "John Wick")
+
+        # Lists are independent
+        self.assertIsNone(self.client.get("other", "uid-1"))
+        self.assertEqual(len(self.server.player_list("lobby")), 1)
+
+        print("Test success!")
+
+    def test_pipeline(self):
+        """
+        Testing a pipeline split over several batches.
+        """
+
+        print("\nStart Test: Pipelined batches...")
+
+        pipeline = self.client.pipeline(batch_size=7)
+        for i in range(50):
+            pipeline.append("lobby", f"uid-{i}", f"Player {i}")
+        pipeline.append("lobby", "uid-0", "Player 0")          # Duplicate
+        for _ in range(51):
+            pipeline.shift("lobby")
+
+        results = pipeline.execute()
+
+        self.assertEqual(len(results), 102)
+        self.assertEqual(results[:50], [None] * 50)
+        self.assertIsInstance(results[50], ValueError)
+        self.assertEqual(results[51:101], [(f"uid-{i}", f"Player {i}") for i in range(50)])
+        self.assertIsInstance(results[101], IndexError)
+        self.assertEqual(len(pipeline), 0)
+
+        print("Test success!")
+
+    def test_concurrent_clients(self):
+        """
+        Testing many threads sharing the client connection pool.
+        """
+
+        print("\nStart Test: Concurrent clients...")
+
+        def worker(n):
+            for i in range(20):
+                self.client.append("lobby", f"uid-{n}-{i}", "Player")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.server.player_list("lobby")), 160)
+
+        print("Test success!")
+
+    def test_bad_requests(self):
+        """
+        Testing unknown ops, malformed payloads and strings too long for
+        the protocol.
+        """
+
+        print("\nStart Test: Bad requests...")
+
+        self.client.append("lobby", "uid-1", "John Wick")
+
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.connect(self.server.address)
+            rfile = sock.makefile("rb")
+
+            # A well formed command with an op the server doesn't know
+            command = (protocol.GET, "lobby", "uid-1", None)
+            payload = bytearray(protocol.encode_commands([command]))
+            payload[2] = 99
+            sock.sendall(protocol.frame(bytes(payload)))
+
+            ((status, uid, name),) = protocol.decode_results(protocol.read_frame(rfile))
+            self.assertEqual(status, protocol.STATUS_BAD_REQUEST)
+            self.assertEqual(uid, "")
+
+            # A string length running past the end of the payload
+            with self.assertLogs(level="WARNING"):
+                sock.sendall(protocol.frame(b"\x00\x01\x06\x05lob"))
+                self.assertIsNone(protocol.read_frame(rfile))
+
+            rfile.close()
+
+        with self.assertRaises(ValueError):
+            self.client.append("lobby", "u" * 0x10000, "Too long")
+        with self.assertRaises(ValueError):
+            self.client.append("l" * 256, "uid-2", "Too long")
+
+        # The duplicate error quotes the uid, it is clipped to fit
+        self.client.append("lobby", "u" * 0xFFFF, "Longest")
+        with self.assertRaises(ValueError):
+            self.client.append("lobby", "u" * 0xFFFF, "Longest")
+
+        # The server and the pooled connection are still usable
+        self.assertEqual(self.client.get("lobby", "uid-1"), ("uid-1", "John Wick"))
+
+        print("Test success!")
+
+    def test_tcp(self):
+        """
+        Testing the server over localhost TCP.
+        """
+
+        print("\nStart Test: Server over TCP...")
+
+        with PlayerListServer(("127.0.0.1", 0)).start() as server:
+            with PlayerListClient(server.address) as client:
+                client.append("lobby", "uid-1", "John Wick")
+                self.assertEqual(client.pop("lobby"), ("uid-1", "John Wick"))
+
+        print("Test success!")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,11 @@
 # player_list_test.py
 
+import gc
 import unittest
 import uuid
+import weakref
+
+from unittest import mock
 
 import sys
 import os
@@ -16,6 +20,8 @@ sys.path.insert(
 from app.player import Player
 from app.player_node import PlayerNode
 from app.player_list import PlayerList
+from app.eviction_policy import EvictionPolicy
+from app.cuckoo_filter import CuckooFilter
 
 class TestPlayerListBehavior(unittest.TestCase):
     """
@@ -356,5 +362,559 @@ class TestPlayerListBehavior(unittest.TestCase):
         # display the nodes descending (default; head to tail)
         self.player_list.display(True)
 
+    def test_remove_tail_with_key(self):
+        """
+        Testing Doubly-Linked List behavior; removing the tail by key
+        """
+
+        print("\nStart Test: Remove list tail by key...")
+
+        self.player_list.append(self.node1)
+        self.player_list.append(self.node2)
+
+        self.assertEqual(self.player_list.remove(self.node2.key), self.node2)
+        self.assertEqual(self.player_list.tail, self.node1)
+        self.assertIsNone(self.player_list.tail.next)
+
+        self.assertEqual(self.player_list.remove(self.node1.key), self.node1)
+        self.assertTrue(self.player_list.is_empty())
+
+        print("Test success!")
+
+    def test_iter_from_key(self):
+        """
+        Testing Doubly-Linked List behavior; iterating from a key in
+        either direction
+        """
+
+        print("\nStart Test: Iterate from key...")
+
+        self.player_list.append(self.node1)
+        self.player_list.append(self.node2)
+        self.player_list.append(self.node3)
+
+        self.assertEqual(list(self.player_list.iter_from(self.node2.key)),
+                         [self.node2, self.node3])
+        self.assertEqual(list(self.player_list.iter_from(self.node2.key, reverse=True)),
+                         [self.node2, self.node1])
+
+        with self.assertRaises(KeyError):
+            self.player_list.iter_from(uuid.uuid4())    # Key not in list
+
+        print("Test success!")
+
+    def test_index_and_slice(self):
+        """
+        Testing Doubly-Linked List behavior; indexing and slicing from
+        the closer end of the list
+        """
+
+        print("\nStart Test: Index and slice...")
+
+        nodes = [PlayerNode(Player(str(uuid.uuid4()), f"Player {i}")) for i in range(9)]
+        for node in nodes:
+            self.player_list.append(node)
+
+        self.assertEqual(self.player_list[0], nodes[0])
+        self.assertEqual(self.player_list[7], nodes[7])
+        self.assertEqual(self.player_list[-2], nodes[-2])
+
+        for window in (slice(2, 5), slice(-4, None), slice(None, -6),
+                       slice(1, 8, 3), slice(None, None, -2), slice(6, 1, -1),
+                       slice(4, 4), slice(-100, 100)):
+            self.assertEqual(self.player_list[window], nodes[window], window)
+
+        with self.assertRaises(IndexError):
+            self.player_list[9]
+
+        with self.assertRaises(IndexError):
+            self.player_list[-10]
+
+        print("Test success!")
+
+    def test_length(self):
+        """
+        Testing Doubly-Linked List behavior; length is maintained
+        through inserts and removals
+        """
+
+        print("\nStart Test: List length...")
+
+        self.assertEqual(len(self.player_list), 0)
+
+        self.player_list.append(self.node1)
+        self.player_list.push(self.node2)
+        self.player_list.insert(-1, self.node3)
+        self.assertEqual(len(self.player_list), 3)
+
+        self.player_list.remove(self.node1.key)
+        self.player_list.shift()
+        self.assertEqual(len(self.player_list), 1)
+
+        self.player_list.pop()
+        self.assertEqual(len(self.player_list), 0)
+
+        print("Test success!")
+
+    def test_bounded_drop_oldest(self):
+        """
+        Testing Doubly-Linked List behavior; bounded list evicts from
+        the tail
+        """
+
+        print("\nStart Test: Bounded list, drop oldest...")
+
+        evicted = []
+        self.player_list = PlayerList(maxlen=2, on_evict=evicted.append)
+
+        self.assertIsNone(self.player_list.push(self.node1))
+        self.assertIsNone(self.player_list.push(self.node2))
+        self.assertTrue(self.player_list.is_full())
+
+        self.assertEqual(self.player_list.push(self.node3), self.node1)
+        self.assertEqual(evicted, [self.node1])
+        self.assertEqual(list(self.player_list), [self.node3, self.node2])
+        self.assertIsNone(self.node1.previous)
+
+        print("Test success!")
+
+    def test_bounded_drop_newest(self):
+        """
+        Testing Doubly-Linked List behavior; bounded list evicts from
+        the head
+        """
+
+        print("\nStart Test: Bounded list, drop newest...")
+
+        self.player_list = PlayerList(maxlen=2, policy=EvictionPolicy.DROP_NEWEST)
+
+        self.player_list.append(self.node1)
+        self.player_list.append(self.node2)
+
+        self.assertEqual(self.player_list.append(self.node3), self.node1)
+        self.assertEqual(list(self.player_list), [self.node2, self.node3])
+        self.assertEqual(len(self.player_list), 2)
+
+        print("Test success!")
+
+    def test_bounded_reject(self):
+        """
+        Testing Doubly-Linked List behavior; bounded list rejects
+        inserts when full
+        """
+
+        print("\nStart Test: Bounded list, reject...")
+
+        self.player_list = PlayerList(maxlen=1, policy=EvictionPolicy.REJECT)
+        self.player_list.append(self.node1)
+
+        with self.assertRaises(IndexError):
+            self.player_list.push(self.node2)
+
+        with self.assertRaises(IndexError):
+            self.player_list.insert(0, self.node2)
+
+        self.assertEqual(list(self.player_list), [self.node1])
+
+        with self.assertRaises(ValueError):
+            PlayerList(maxlen=0)
+
+        print("Test success!")
+
+    def test_move_to_head_and_tail(self):
+        """
+        Testing Doubly-Linked List behavior; moving a node by key
+        """
+
+        print("\nStart Test: Move by key...")
+
+        self.player_list.append(self.node1)
+        self.player_list.append(self.node2)
+        self.player_list.append(self.node3)
+
+        self.player_list.move(self.node2.key, 0)
+        self.assertEqual(list(self.player_list), [self.node2, self.node1, self.node3])
+
+        self.player_list.move(self.node2.key, -1)
+        self.assertEqual(list(self.player_list), [self.node1, self.node3, self.node2])
+        self.assertEqual(list(reversed(self.player_list)), [self.node2, self.node3, self.node1])
+
+        self.player_list.move(self.node2.key, -1)    # Already at tail
+        self.assertEqual(self.player_list.tail, self.node2)
+        self.assertEqual(len(self.player_list), 3)
+
+        with self.assertRaises(KeyError):
+            self.player_list.move(uuid.uuid4(), 0)
+
+        print("Test success!")
+
+    def test_clear(self):
+        """
+        Testing Doubly-Linked List behavior; clearing the list unlinks
+        every node
+        """
+
+        print("\nStart Test: Clear list...")
+
+        self.player_list.append(self.node1)
+        self.player_list.append(self.node2)
+        self.player_list.append(self.node3)
+
+        self.player_list.clear()
+
+        self.assertTrue(self.player_list.is_empty())
+        self.assertEqual(len(self.player_list), 0)
+        self.assertIsNone(self.player_list.tail)
+        self.assertIsNone(self.node2.previous)
+        self.assertIsNone(self.node2.next)
+
+        # Nodes can be reused after clearing
+        self.player_list.push(self.node2)
+        self.assertEqual(list(self.player_list), [self.node2])
+
+        print("Test success!")
+
+    def test_weak_links(self):
+        """
+        Testing Doubly-Linked List behavior; weak previous links keep
+        list behavior and leave no reference cycles
+        """
+
+        print("\nStart Test: Weak links...")
+
+        self.player_list = PlayerList(weak_links=True)
+        self.player_list.append(self.node1)
+        self.player_list.append(self.node2)
+        self.player_list.push(self.node3)
+        self.player_list.remove(self.node1.key)
+
+        self.assertEqual(list(reversed(self.player_list)), [self.node2, self.node3])
+        self.assertEqual(self.node2.previous, self.node3)
+        self.assertEqual(self.player_list.pop(), self.node2)
+        self.assertIsNone(self.player_list.tail.previous)
+
+        # Without the collector, clearing the list must free the chain
+        self.player_list = PlayerList(weak_links=True)
+        nodes = [PlayerNode(Player(str(uuid.uuid4()), "Weak")) for _ in range(100)]
+        for node in nodes:
+            self.player_list.append(node)
+        watched = weakref.ref(nodes[50])
+        del node, nodes
+
+        gc.disable()
+        try:
+            self.player_list.clear()
+            self.assertIsNone(watched())
+        finally:
+            gc.enable()
+
+        print("Test success!")
+
+    def test_weak_links_reuse_after_clear(self):
+        """
+        Testing Doubly-Linked List behavior; nodes released by clear()
+        with weak previous links can be inserted again
+        """
+
+        print("\nStart Test: Weak links reuse after clear...")
+
+        self.player_list = PlayerList(weak_links=True)
+        nodes = [PlayerNode(Player(f"u{i}", f"Player {i}")) for i in range(5)]
+        for node in nodes:
+            self.player_list.append(node)
+
+        self.player_list.clear()
+
+        for node in nodes:
+            self.assertIsNone(node.previous)
+            self.assertIsNone(node.next)
+
+        self.player_list.append(nodes[2])
+        self.assertEqual(len(self.player_list), 1)
+        self.assertEqual([node.key for node in self.player_list], ["u2"])
+
+        cleared = PlayerList(weak_links=True)
+        cleared.append(nodes[0])
+        self.assertEqual([node.key for node in cleared], ["u0"])
+        self.assertEqual([node.key for node in reversed(cleared)], ["u0"])
+
+        print("Test success!")
+
+    def test_insert_after_and_before(self):
+        """
+        Testing Doubly-Linked List behavior; inserting next to a known
+        node
+        """
+
+        print("\nStart Test: Insert after and before a node...")
+
+        self.player_list.append(self.node1)
+        self.player_list.insert_after(self.node1, self.node3)     # At tail
+        self.player_list.insert_after(self.node1, self.node2)     # Internal
+
+        self.assertEqual(list(self.player_list), [self.node1, self.node2, self.node3])
+        self.assertEqual(list(reversed(self.player_list)), [self.node3, self.node2, self.node1])
+
+        node4 = PlayerNode(Player(uuid.uuid4(), "Santino D'Antonio"))
+        node5 = PlayerNode(Player(uuid.uuid4(), "Winston"))
+        self.player_list.insert_before(self.node1, node4)         # At head
+        self.player_list.insert_before(self.node3, node5)         # Internal
+
+        self.assertEqual(list(self.player_list),
+                         [node4, self.node1, self.node2, node5, self.node3])
+        self.assertEqual(self.player_list.head, node4)
+        self.assertEqual(self.node3.previous, node5)
+        self.assertEqual(len(self.player_list), 5)
+
+        with self.assertRaises(ValueError):
+            self.player_list.insert_after(self.node2x, PlayerNode(Player(uuid.uuid4(), "x")))
+
+        with self.assertRaises(ValueError):
+            self.player_list.insert_before(self.node2, self.node2x)  # Duplicate
+
+        print("Test success!")
+
+    def test_remove_and_replace_node(self):
+        """
+        Testing Doubly-Linked List behavior; removing and replacing a
+        known node
+        """
+
+        print("\nStart Test: Remove and replace a node...")
+
+        self.player_list.append(self.node1)
+        self.player_list.append(self.node2)
+        self.player_list.append(self.node3)
+
+        # Same key, different node instance
+        self.assertEqual(self.player_list.replace(self.node2, self.node2x), self.node2)
+        self.assertEqual(list(self.player_list), [self.node1, self.node2x, self.node3])
+        self.assertEqual(self.player_list.get(self.node2.key), self.node2x)
+
+        with self.assertRaises(ValueError):
+            self.player_list.remove_node(self.node2)              # No longer in list
+
+        with self.assertRaises(ValueError):
+            self.player_list.replace(self.node1, self.node2)      # Duplicate key
+
+        node4 = PlayerNode(Player(uuid.uuid4(), "Santino D'Antonio"))
+        self.player_list.replace(self.node1, node4)
+        self.assertEqual(self.player_list.head, node4)
+        self.assertIsNone(self.node1.next)
+
+        self.assertEqual(self.player_list.remove_node(self.node3), self.node3)
+        self.assertEqual(list(reversed(self.player_list)), [self.node2x, node4])
+        self.assertEqual(len(self.player_list), 2)
+
+        print("Test success!")
+
+    def test_insert_after_evicted_anchor(self):
+        """
+        Testing Doubly-Linked List behavior; inserting after a node that
+        is evicted to make room
+        """
+
+        print("\nStart Test: Insert after evicted node...")
+
+        self.player_list = PlayerList(maxlen=2)
+        self.player_list.append(self.node1)
+        self.player_list.append(self.node2)
+
+        self.assertEqual(self.player_list.insert_after(self.node2, self.node3), self.node2)
+        self.assertEqual(list(self.player_list), [self.node1, self.node3])
+
+        print("Test success!")
+
+    def test_filtered_list_without_index(self):
+        """
+        Testing Doubly-Linked List behavior; duplicate checks and key
+        lookups with a membership filter and no index
+        """
+
+        print("\nStart Test: Filtered list without index...")
+
+        self.player_list = PlayerList(index=False,
+                                      membership_filter=CuckooFilter(capacity=100))
+
+        self.player_list.append(self.node1)
+        self.player_list.append(self.node2)
+        self.player_list.push(self.node3)
+
+        with self.assertRaises(ValueError):
+            self.player_list.append(self.node2x)       # Duplicate player
+
+        self.assertEqual(self.player_list.get(self.node2.key), self.node2)
+        self.assertIsNone(self.player_list.get(uuid.uuid4()))
+        self.assertEqual(self.player_list.remove(self.node1.key), self.node1)
+        self.assertIsNone(self.player_list.remove(self.node1.key))
+
+        # Removed keys can be added again
+        self.player_list.insert_after(self.node2, self.node1)
+        self.assertEqual(list(self.player_list), [self.node3, self.node2, self.node1])
+
+        with self.assertRaises(ValueError):
+            self.player_list.remove_node(self.node2x)  # Same key, not in list
+
+        print("Test success!")
+
+    def test_node_handles_without_index(self):
+        """
+        Testing Doubly-Linked List behavior; node handle methods check
+        membership through the node rather than by key lookup
+        """
+
+        print("\nStart Test: Node handles without index...")
+
+        self.player_list = PlayerList(index=False,
+                                      membership_filter=CuckooFilter(capacity=100))
+        self.player_list.append(self.node1)
+        self.player_list.append(self.node3)
+
+        other = PlayerList()
+        other.append(self.node2x)
+
+        with mock.patch.object(PlayerList, "_find", side_effect=AssertionError("Key lookup")):
+            self.player_list.insert_before(self.node3, self.node2)
+            self.assertEqual(self.player_list.remove_node(self.node1), self.node1)
+            self.player_list.replace(self.node3, self.node1)
+
+            for node in (self.node3, self.node2x, None):         # Removed, other list
+                with self.assertRaises(ValueError):
+                    self.player_list.insert_after(node, PlayerNode(Player(uuid.uuid4(), "New")))
+
+        self.assertEqual(list(self.player_list), [self.node2, self.node1])
+        self.assertEqual(self.node2.owner, self.player_list)
+        self.assertIsNone(self.node3.owner)
+
+        self.player_list.clear()
+        self.assertIsNone(self.node2.owner)
+
+        with self.assertRaises(ValueError):
+            self.player_list.remove_node(self.node2)
+
+        print("Test success!")
+
+    def test_sample(self):
+        """
+        Testing Doubly-Linked List behavior; random samples follow
+        inserts and removals, and are reproducible with a seed
+        """
+
+        print("\nStart Test: Sample...")
+
+        nodes = [PlayerNode(Player(f"uid-{i}", f"Player {i}")) for i in range(50)]
+        for node in nodes:
+            self.player_list.append(node)
+
+        sample = self.player_list.sample(10, seed=7)
+        self.assertEqual(len({node.key for node in sample}), 10)
+        self.assertEqual(sample, self.player_list.sample(10, seed=7))
+
+        for node in nodes[:40]:
+            self.player_list.remove(node.key)
+        self.player_list.push(self.node1)
+
+        remaining = set(nodes[40:]) | {self.node1}
+        self.assertEqual(set(self.player_list.sample(11)), remaining)
+
+        with self.assertRaises(ValueError):
+            self.player_list.sample(12)
+
+        self.player_list.clear()
+        self.assertEqual(self.player_list.sample(0), [])
+
+        print("Test success!")
+
+    def test_weighted_sample(self):
+        """
+        Testing Doubly-Linked List behavior; weighted samples skip
+        nodes with no weight
+        """
+
+        print("\nStart Test: Weighted sample...")
+
+        nodes = [PlayerNode(Player(f"uid-{i}", f"Player {i}")) for i in range(20)]
+        for node in nodes:
+            self.player_list.append(node)
+
+        def weight(node):
+            return 1.0 if int(node.key[4:]) % 2 else 0.0
+
+        sample = self.player_list.sample(5, weight=weight, seed=1)
+        self.assertEqual(len(sample), 5)
+        self.assertTrue(all(weight(node) for node in sample))
+
+        # Tiny weights force the exact fallback
+        sample = self.player_list.sample(10, weight=lambda n: weight(n) * 1e-9, seed=1)
+        self.assertEqual(set(sample), {node for node in nodes if weight(node)})
+
+        with self.assertRaises(ValueError):
+            self.player_list.sample(11, weight=weight)
+
+        print("Test success!")
+
+    def test_sample_window(self):
+        """
+        Testing Doubly-Linked List behavior; sampling the neighbours of
+        a node
+        """
+
+        print("\nStart Test: Sample window...")
+
+        nodes = [PlayerNode(Player(f"uid-{i}", f"Player {i}")) for i in range(10)]
+        for node in nodes:
+            self.player_list.append(node)
+
+        self.assertEqual(self.player_list.sample_window("uid-5", 2),
+                         [nodes[3], nodes[4], nodes[6], nodes[7]])
+        self.assertEqual(self.player_list.sample_window("uid-1", 3),
+                         [nodes[0], nodes[2], nodes[3], nodes[4]])
+
+        sample = self.player_list.sample_window("uid-5", 3, k=2, seed=3)
+        self.assertEqual(len(sample), 2)
+        self.assertEqual(sample, self.player_list.sample_window("uid-5", 3, k=2, seed=3))
+        self.assertTrue(set(sample) <= set(nodes[2:9]) - {nodes[5]})
+
+        with self.assertRaises(KeyError):
+            self.player_list.sample_window("uid-missing", 2)
+
+        print("Test success!")
+
+    def test_sort_in_place(self):
+        """
+        Testing Doubly-Linked List behavior; stable in-place sort by key
+        or name, in either order
+        """
+
+        print("\nStart Test: Sort in place...")
+
+        names = ["Viggo", "Iosef", "John", "Winston", "Charon", "John", "Ares"]
+        nodes = [PlayerNode(Player(f"uid-{i}", name)) for i, name in enumerate(names)]
+        for node in nodes:
+            self.player_list.push(node)
+
+        by_name = lambda node: node.player.name
+
+        self.player_list.sort(key=by_name)
+        expected = sorted(reversed(nodes), key=by_name)
+        self.assertEqual(list(self.player_list), expected)        # Stable
+        self.assertEqual(list(reversed(self.player_list)), expected[::-1])
+        self.assertEqual(self.player_list.head, expected[0])
+        self.assertEqual(self.player_list.tail, expected[-1])
+        self.assertIsNone(self.player_list.head.previous)
+        self.assertIsNone(self.player_list.tail.next)
+
+        self.player_list.sort(key=by_name, reverse=True)
+        self.assertEqual(list(self.player_list),
+                         sorted(expected, key=by_name, reverse=True))
+
+        self.player_list.sort()
+        self.assertEqual(list(self.player_list), nodes)
+        self.assertEqual(self.player_list.get("uid-3"), nodes[3])
+        self.assertEqual(self.player_list[-2:], nodes[-2:])
+        self.assertEqual(len(self.player_list), 7)
+
+        print("Test success!")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
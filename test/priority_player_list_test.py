@@ -0,0 +1,104 @@
+# priority_player_list_test.py
+
+import unittest
+
+import sys
+import os
+
+# Add the project directory to sys.path so the file can be run without 
+# running module.
+# Added for convenience to run from VSCode rather than running module
+# or pytest from terminal.
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.player import Player
+from app.player_node import PlayerNode
+from app.priority_player_list import PriorityPlayerList
+
+PREMIUM, RANKED, CASUAL = range(3)
+
+class TestPriorityPlayerListBehavior(unittest.TestCase):
+    """
+    Test the behavior of the priority-laned list
+    """
+
+    def setUp(self):
+        """
+        unittest function for setup before each test
+        """
+
+        self.queue = PriorityPlayerList(lanes=3)
+
+    def node(self, i):
+        return PlayerNode(Player(f"uid-{i}", f"Player {i}"))
+
+    def test_shift_in_priority_order(self):
+        """
+        Testing that shift drains the highest priority lane first.
+        """
+
+        print("\nStart Test: Shift in priority order...")
+
+        self.queue.enqueue(self.node(0), CASUAL)
+        self.queue.enqueue(self.node(1), RANKED)
+        self.queue.enqueue(self.node(2), CASUAL)
+        self.queue.enqueue(self.node(3), PREMIUM)
+
+        self.assertEqual(len(self.queue), 4)
+        self.assertEqual([node.key for node in self.queue],
+                         ["uid-3", "uid-1", "uid-0", "uid-2"])
+
+        shifted = [self.queue.shift().key for _ in range(4)]
+        self.assertEqual(shifted, ["uid-3", "uid-1", "uid-0", "uid-2"])
+        self.assertTrue(self.queue.is_empty())
+
+        with self.assertRaises(IndexError):
+            self.queue.shift()
+
+        print("Test success!")
+
+    def test_duplicates_across_lanes(self):
+        """
+        Testing that a player can only be queued in one lane.
+        """
+
+        print("\nStart Test: Duplicates across lanes...")
+
+        self.queue.enqueue(self.node(0), CASUAL)
+
+        with self.assertRaises(ValueError):
+            self.queue.enqueue(self.node(0), PREMIUM)
+
+        with self.assertRaises(ValueError):
+            self.queue.enqueue(self.node(1), 3)
+
+        self.assertEqual(self.queue.lane_of("uid-0"), CASUAL)
+
+        print("Test success!")
+
+    def test_move_and_remove(self):
+        """
+        Testing moving a player between lanes and removing by key.
+        """
+
+        print("\nStart Test: Move and remove...")
+
+        self.queue.enqueue(self.node(0), CASUAL)
+        self.queue.enqueue(self.node(1), RANKED)
+
+        self.queue.move("uid-0", PREMIUM)
+        self.assertEqual(self.queue.lane_of("uid-0"), PREMIUM)
+        self.assertTrue(self.queue.lane(CASUAL).is_empty())
+
+        self.assertEqual(self.queue.remove("uid-0").key, "uid-0")
+        self.assertIsNone(self.queue.remove("uid-0"))
+        self.assertEqual(self.queue.shift().key, "uid-1")
+
+        with self.assertRaises(KeyError):
+            self.queue.move("uid-0", RANKED)
+
+        print("Test success!")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+# roster_loader_test.py
+
+import csv
+import json
+import unittest
+import tempfile
+
+import sys
+import os
+
+# Add the project directory to sys.path so the file can be run without 
+# running module.
+# Added for convenience to run from VSCode rather than running module
+# or pytest from terminal.
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import roster_loader
+from app.player import Player
+from app.player_node import PlayerNode
+from app.player_list import PlayerList
+
+class TestRosterLoaderBehavior(unittest.TestCase):
+    """
+    Test the streaming roster loader
+    """
+
+    def setUp(self):
+        """
+        unittest function for setup before each test
+        """
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.rows = [(f"uid-{i}", f"Player, {i}") for i in range(200)]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_csv(self):
+        path = os.path.join(self.temp_dir.name, "roster.csv")
+        with open(path, "w", newline="") as roster:
+            roster.write("uid,name\n")
+            for uid, name in self.rows + self.rows[:5]:     # With repeats
+                roster.write(f'{uid},"{name}"\n')
+        return path
+
+    def write_jsonl(self):
+        path = os.path.join(self.temp_dir.name, "roster.jsonl")
+        with open(path, "w") as roster:
+            for uid, name in self.rows:
+                roster.write(json.dumps({"uid": uid, "name": name}) + "\n")
+        return path
+
+    def test_chunks_end_on_line_boundary(self):
+        """
+        Testing that chunks split on whole lines and cover the file.
+        """
+
+        print("\nStart Test: Chunk boundaries...")
+
+        path = self.write_jsonl()
+        chunks = list(roster_loader.read_chunks(path, chunk_size=100))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(data.endswith(b"\n") for data, _ in chunks))
+        self.assertEqual(chunks[-1][1], os.path.getsize(path))
+
+        with open(path, "rb") as roster:
+            self.assertEqual(b"".join(data for data, _ in chunks), roster.read())
+
+        print("Test success!")
+
+    def test_load_csv_in_process(self):
+        """
+        Testing loading a CSV roster, skipping duplicates.
+        """
+
+        print("\nStart Test: Load CSV roster...")
+
+        player_list = PlayerList()
+        player_list.append(PlayerNode(Player("uid-0", "Already here")))
+        progress = []
+
+        loaded = player_list.load_stream(self.write_csv(), chunk_size=256,
+                                         workers=0, progress=lambda *p: progress.append(p))
+
+        self.assertEqual(loaded, 199)
+        self.assertEqual([(node.key, node.player.name) for node in player_list][1:],
+                         self.rows[1:])
+        self.assertEqual(player_list.head.player.name, "Already here")
+        self.assertEqual(progress[-1][0], progress[-1][1])
+        self.assertEqual(progress[-1][2], 199)
+
+        print("Test success!")
+
+    def test_load_jsonl_in_process_pool(self):
+        """
+        Testing loading a JSONL roster with parallel parsing.
+        """
+
+        print("\nStart Test: Load JSONL roster with workers...")
+
+        player_list = PlayerList()
+        loaded = player_list.load_stream(self.write_jsonl(), chunk_size=512, workers=2)
+
+        self.assertEqual(loaded, 200)
+        self.assertEqual([(node.key, node.player.name) for node in player_list], self.rows)
+
+        print("Test success!")
+
+    def test_line_breaks_inside_values(self):
+        """
+        Testing that only "\\n" ends a JSONL row, and that CSV quoted
+        newlines stay in the field across chunk boundaries.
+        """
+
+        print("\nStart Test: Line breaks inside values...")
+
+        jsonl = (json.dumps({"uid": "a", "name": "X\u2028Y"}, ensure_ascii=False) + "\n" +
+                 json.dumps({"uid": "b", "name": "X\rY"}) + "\r\n").encode("utf-8")
+        self.assertEqual(roster_loader.parse_chunk(jsonl, "jsonl"),
+                         [("a", "X\u2028Y"), ("b", "X\rY")])
+
+        self.assertEqual(roster_loader.parse_chunk("a,X\x85Y\r\n".encode("utf-8"), "csv"),
+                         [("a", "X\x85Y")])
+
+        path = os.path.join(self.temp_dir.name, "multiline.csv")
+        rows = [(f"uid-{i}", f"Line {i}\nLine \"{i}\"\r\nEnd") for i in range(50)]
+        with open(path, "w", newline="") as roster:
+            csv.writer(roster).writerows(rows)
+
+        for data, _ in roster_loader.read_chunks(path, chunk_size=64, format="csv"):
+            self.assertEqual(data.count(b'"') % 2, 0)
+
+        player_list = PlayerList()
+        player_list.load_stream(path, chunk_size=64, workers=0)
+        self.assertEqual([(node.key, node.player.name) for node in player_list], rows)
+
+        print("Test success!")
+
+    def test_bad_input(self):
+        """
+        Testing unsupported formats and malformed rows.
+        """
+
+        print("\nStart Test: Bad roster input...")
+
+        path = os.path.join(self.temp_dir.name, "roster.txt")
+        with open(path, "w") as roster:
+            roster.write("uid-1\n")
+
+        with self.assertRaises(ValueError):
+            PlayerList().load_stream(path, workers=0)
+
+        with self.assertRaises(ValueError):
+            PlayerList().load_stream(path, format="csv", workers=0)
+
+        print("Test success!")
+
+if __name__ == '__main__':
+    unittest.main()
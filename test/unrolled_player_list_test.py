@@ -0,0 +1,160 @@
+# unrolled_player_list_test.py
+
+import unittest
+import uuid
+
+import sys
+import os
+
+# Add the project directory to sys.path so the file can be run without 
+# running module.
+# Added for convenience to run from VSCode rather than running module
+# or pytest from terminal.
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.player import Player
+from app.player_node import PlayerNode
+from app.unrolled_player_list import UnrolledPlayerList
+
+class TestUnrolledPlayerListBehavior(unittest.TestCase):
+    """
+    Test the behavior of the Unrolled Linked List implementation
+    """
+
+    def setUp(self):
+        """
+        unittest function for setup before each test
+        """
+
+        # Small blocks so that splits and merges happen in the tests
+        self.player_list = UnrolledPlayerList(block_capacity=4)
+        self.players = [Player(str(uuid.uuid4()), f"Player {i}") for i in range(20)]
+
+    def keys(self, player_list):
+        return [node.key for node in player_list]
+
+    def test_push_and_append_keep_order(self):
+        """
+        Testing insert to head and tail across block splits.
+        """
+
+        print("\nStart Test: Push and append across blocks...")
+
+        for player in self.players[10:]:
+            self.player_list.append(PlayerNode(player))
+        for player in reversed(self.players[:10]):
+            self.player_list.push(PlayerNode(player))
+
+        expected = [player.uid for player in self.players]
+        self.assertEqual(self.keys(self.player_list), expected)
+        self.assertEqual([n.key for n in reversed(self.player_list)], expected[::-1])
+        self.assertEqual(len(self.player_list), 20)
+        self.assertEqual(self.player_list.head.key, expected[0])
+        self.assertEqual(self.player_list.tail.key, expected[-1])
+
+        print("Test success!")
+
+    def test_insert_with_duplicate_node(self):
+        """
+        Testing invalid insert to list (duplication of player)
+        """
+
+        print("\nStart Test: Insert duplicates...")
+
+        self.player_list.append(PlayerNode(self.players[0]))
+
+        with self.assertRaises(ValueError):
+            self.player_list.push(PlayerNode(self.players[0]))
+
+        with self.assertRaises(ValueError):
+            self.player_list.append(None)
+
+        with self.assertRaises(RuntimeError):
+            self.player_list.insert(3, PlayerNode(self.players[1]))
+
+        self.player_list.insert(-1, PlayerNode(self.players[1]))
+        self.assertEqual(len(self.player_list), 2)
+
+        print("Test success!")
+
+    def test_remove_merges_blocks(self):
+        """
+        Testing removal from head, tail and by key, with block merges.
+        """
+
+        print("\nStart Test: Remove across blocks...")
+
+        for player in self.players:
+            self.player_list.append(PlayerNode(player))
+
+        expected = [player.uid for player in self.players]
+
+        self.assertEqual(self.player_list.shift().key, expected.pop(0))
+        self.assertEqual(self.player_list.pop().key, expected.pop())
+
+        for key in expected[3:12]:
+            self.assertEqual(self.player_list.remove(key).key, key)
+        del expected[3:12]
+
+        self.assertIsNone(self.player_list.remove(self.players[0].uid))
+        self.assertEqual(self.keys(self.player_list), expected)
+
+        while not self.player_list.is_empty():
+            self.player_list.pop()
+
+        self.assertEqual(len(self.player_list), 0)
+        self.assertIsNone(self.player_list.head)
+
+        with self.assertRaises(IndexError):
+            self.player_list.shift()
+
+        print("Test success!")
+
+    def test_remove_by_key_after_splits(self):
+        """
+        Testing removal by key finds nodes moved by splits and merges,
+        and that the inserted nodes themselves are handed back.
+        """
+
+        print("\nStart Test: Remove by key after splits...")
+
+        nodes = [PlayerNode(player) for player in self.players]
+
+        for i, node in enumerate(nodes):
+            if i % 2:
+                self.player_list.push(node)
+            else:
+                self.player_list.append(node)
+
+        self.assertIs(self.player_list.head, nodes[-1])
+        self.assertIs(self.player_list.tail, nodes[-2])
+        self.assertIsNone(self.player_list.head.next)
+        self.assertEqual(sorted(map(id, self.player_list)), sorted(map(id, nodes)))
+        self.assertEqual(list(self.player_list.players()),
+                         [node.player for node in self.player_list])
+
+        for node in nodes[::3] + nodes[1::3] + nodes[2::3]:
+            self.assertIs(self.player_list.remove(node.key), node)
+
+        self.assertTrue(self.player_list.is_empty())
+        self.assertEqual(len(self.player_list), 0)
+
+        self.player_list.push(nodes[0])
+        self.assertIs(self.player_list.shift(), nodes[0])
+
+        print("Test success!")
+
+    def test_display_list(self):
+        """
+        Testing display in both orders.
+        """
+
+        for player in self.players[:3]:
+            self.player_list.append(PlayerNode(player))
+
+        self.player_list.display()
+        self.player_list.display(True)
+
+if __name__ == '__main__':
+    unittest.main()